@@ -1,10 +1,64 @@
 """Configuration manager for loading and validating settings."""
 
-import yaml
 import os
-from typing import Dict, Any, Optional
+import copy
+import hashlib
+import json
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import fields
+from typing import Dict, Any, Optional, Tuple
 from .settings import GenerationConfig
 
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+# Suffix of the JSON sidecar holding the parsed contents of a YAML config
+_SIDECAR_SUFFIX = '.cache.json'
+
+
+def _parse_bool(value: str) -> bool:
+    """Interpret an environment variable value as a boolean flag."""
+    return value.lower() in ('true', '1', 'yes')
+
+
+# Environment variables that override configuration values: env var -> (section, key, converter)
+_ENV_OVERRIDES = {
+    'DATASET_OUTPUT_DIR': ('output', 'output_dir', str),
+    'DATASET_EMPLOYEE_COUNT': ('organization', 'employee_count', int),
+    'DATASET_DOCUMENT_COUNT': ('content_volumes', 'documents', int),
+    'DATASET_VALIDATION': ('output', 'validation', _parse_bool),
+}
+
+# Parsed configurations keyed by (path, mtime, size, env overrides) or by
+# (SHA-256 of file contents, env overrides), least recently used first
+_CONFIG_CACHE: "OrderedDict[Tuple[Any, ...], GenerationConfig]" = OrderedDict()
+_CONFIG_CACHE_SIZE = 32
+_CONFIG_CACHE_LOCK = threading.Lock()
+
+
+def _yaml_codec() -> Tuple[Any, Any, Any]:
+    """Import PyYAML on first use, preferring the libyaml-backed C loader/dumper.
+    
+    Returns:
+        Tuple of (yaml module, loader class, dumper class)
+    """
+    import yaml
+    try:
+        return yaml, yaml.CSafeLoader, yaml.CSafeDumper
+    except AttributeError:
+        return yaml, yaml.SafeLoader, yaml.SafeDumper
+
+
+def _hydrate(section: Any, data: Dict[str, Any]) -> None:
+    """Copy values for the section dataclass's fields from data, ignoring unknown keys."""
+    for f in fields(section):
+        if f.name in data:
+            setattr(section, f.name, data[f.name])
+
 
 class ConfigurationManager:
     """Manages configuration loading, validation, and environment overrides."""
@@ -17,6 +71,7 @@ class ConfigurationManager:
         """
         self.config_path = config_path
         self._config: Optional[GenerationConfig] = None
+        self._config_lock = threading.Lock()
     
     def load_config(self) -> GenerationConfig:
         """Load configuration from file or create default."""
@@ -26,81 +81,154 @@ class ConfigurationManager:
             return self._create_default_config()
     
     def _load_from_file(self) -> GenerationConfig:
-        """Load configuration from YAML file."""
+        """Load configuration from YAML file, reusing a cached parse if the file is unchanged."""
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                config_data = yaml.safe_load(f)
+            stat = os.stat(self.config_path)
+            cache_key = (os.path.abspath(self.config_path), stat.st_mtime_ns, stat.st_size,
+                         self._environment_key())
+            cached = self._cached_config(cache_key)
+            if cached is not None:
+                return copy.deepcopy(cached)
+            
+            with open(self.config_path, 'rb') as f:
+                raw = f.read()
+            
+            # Identical content seen under another path or mtime (copies, touched files)
+            digest = hashlib.sha256(raw).digest()
+            content_key = (digest, cache_key[-1])
+            cached = self._cached_config(content_key)
+            if cached is not None:
+                self._cache_config(content_key, cached)
+                self._cache_config(cache_key, cached)
+                return copy.deepcopy(cached)
+            
+            config_data = self._read_config_data(raw, digest.hex())
+            
+            # Convert to GenerationConfig object
+            config = self._dict_to_config(config_data)
             
             # Apply environment overrides
-            config_data = self._apply_environment_overrides(config_data)
+            self._apply_environment_overrides(config)
             
             # Validate configuration
-            self._validate_config(config_data)
+            self._validate_config(config)
             
-            # Convert to GenerationConfig object
-            return self._dict_to_config(config_data)
+            self._cache_config(content_key, config)
+            self._cache_config(cache_key, config)
+            return copy.deepcopy(config)
             
         except Exception as e:
             raise ValueError(f"Failed to load configuration from {self.config_path}: {e}")
     
+    def _read_config_data(self, raw: bytes, digest: str) -> Dict[str, Any]:
+        """Decode config data, preferring a matching JSON sidecar over parsing YAML.
+        
+        Args:
+            raw: Contents of the YAML configuration file
+            digest: SHA-256 hex digest of raw, which the sidecar must have been built from
+        """
+        sidecar_path = self.config_path + _SIDECAR_SUFFIX
+        try:
+            with open(sidecar_path, 'rb') as f:
+                sidecar = f.read()
+            sidecar = _orjson.loads(sidecar) if _orjson else json.loads(sidecar)
+            if isinstance(sidecar, dict) and sidecar.get('sha256') == digest:
+                return sidecar['config']
+        except (OSError, ValueError, KeyError):
+            pass  # Missing or unreadable sidecar, fall back to YAML
+        
+        yaml, loader, _ = _yaml_codec()
+        config_data = yaml.load(raw, Loader=loader)
+        
+        self._write_sidecar(sidecar_path, config_data, digest)
+        return config_data
+    
+    @staticmethod
+    def _write_sidecar(sidecar_path: str, config_data: Any, digest: str) -> None:
+        """Atomically write the JSON sidecar, skipping it if the directory is not writable."""
+        directory = os.path.dirname(sidecar_path) or '.'
+        if not os.access(directory, os.W_OK):
+            return
+        
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump({'sha256': digest, 'config': config_data}, f, ensure_ascii=False)
+                os.replace(tmp_path, sidecar_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, TypeError, ValueError):
+            pass  # YAML values that JSON cannot represent (e.g. dates) are simply not cached
+    
     def _create_default_config(self) -> GenerationConfig:
         """Create default configuration."""
+        # The default config has no inputs besides the environment
+        cache_key = (None, self._environment_key())
+        cached = self._cached_config(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+        
         config = GenerationConfig()
         
         # Apply environment overrides to default config
-        config_dict = config.to_dict()
-        config_dict = self._apply_environment_overrides(config_dict)
+        self._apply_environment_overrides(config)
         
-        return self._dict_to_config(config_dict)
+        self._cache_config(cache_key, config)
+        return copy.deepcopy(config)
+    
+    @staticmethod
+    def _environment_key() -> Tuple[Optional[str], ...]:
+        """Snapshot the environment overrides that affect the loaded configuration."""
+        return tuple(os.environ.get(env_var) for env_var in _ENV_OVERRIDES)
+    
+    @staticmethod
+    def _cached_config(cache_key: Tuple[Any, ...]) -> Optional[GenerationConfig]:
+        """Look up a cached configuration, marking it most recently used."""
+        with _CONFIG_CACHE_LOCK:
+            cached = _CONFIG_CACHE.get(cache_key)
+            if cached is not None:
+                _CONFIG_CACHE.move_to_end(cache_key)
+            return cached
     
-    def _apply_environment_overrides(self, config_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Apply environment variable overrides to configuration."""
-        # Check for common environment overrides
-        env_overrides = {
-            'DATASET_OUTPUT_DIR': ('output', 'output_dir'),
-            'DATASET_EMPLOYEE_COUNT': ('organization', 'employee_count'),
-            'DATASET_DOCUMENT_COUNT': ('content_volumes', 'documents'),
-            'DATASET_VALIDATION': ('output', 'validation'),
-        }
-        
-        for env_var, (section, key) in env_overrides.items():
-            if env_var in os.environ:
-                value = os.environ[env_var]
-                
-                # Convert to appropriate type
-                if key in ['employee_count', 'documents']:
-                    value = int(value)
-                elif key == 'validation':
-                    value = value.lower() in ('true', '1', 'yes')
-                
-                # Apply override
-                if section not in config_data:
-                    config_data[section] = {}
-                config_data[section][key] = value
+    @staticmethod
+    def _cache_config(cache_key: Tuple[Any, ...], config: GenerationConfig) -> None:
+        """Store a loaded configuration, evicting the least recently used entry if full."""
+        with _CONFIG_CACHE_LOCK:
+            _CONFIG_CACHE[cache_key] = config
+            _CONFIG_CACHE.move_to_end(cache_key)
+            if len(_CONFIG_CACHE) > _CONFIG_CACHE_SIZE:
+                _CONFIG_CACHE.popitem(last=False)
+    
+    def _apply_environment_overrides(self, config: GenerationConfig) -> None:
+        """Apply environment variable overrides to configuration in place."""
+        environ = os.environ
+        present = [env_var for env_var in _ENV_OVERRIDES if env_var in environ]
+        if not present:
+            return
         
-        return config_data
+        for env_var in present:
+            section, key, convert = _ENV_OVERRIDES[env_var]
+            setattr(getattr(config, section), key, convert(environ[env_var]))
     
-    def _validate_config(self, config_data: Dict[str, Any]) -> None:
+    def _validate_config(self, config: GenerationConfig) -> None:
         """Validate configuration values and constraints."""
         # Validate organization settings
-        org = config_data.get('organization', {})
-        if org.get('employee_count', 0) < 1:
+        if config.organization.employee_count < 1:
             raise ValueError("Employee count must be at least 1")
         
-        if not org.get('teams'):
+        if not config.organization.teams:
             raise ValueError("At least one team must be specified")
         
         # Validate content volumes
-        volumes = config_data.get('content_volumes', {})
-        if volumes.get('documents', 0) < 1:
+        if config.content_volumes.documents < 1:
             raise ValueError("Document count must be at least 1")
         
         # Validate temporal settings
-        temporal = config_data.get('temporal', {})
         try:
-            from datetime import datetime
-            start_date = datetime.fromisoformat(temporal.get('start_date', '2024-01-01'))
-            end_date = datetime.fromisoformat(temporal.get('end_date', '2025-10-24'))
+            start_date = config.temporal.start_dt
+            end_date = config.temporal.end_dt
             if start_date >= end_date:
                 raise ValueError("Start date must be before end date")
         except ValueError as e:
@@ -108,50 +236,40 @@ class ConfigurationManager:
     
     def _dict_to_config(self, config_data: Dict[str, Any]) -> GenerationConfig:
         """Convert dictionary to GenerationConfig object."""
-        # This is a simplified conversion - in a full implementation,
-        # you'd want more robust mapping from dict to dataclass
         config = GenerationConfig()
         
-        # Update organization settings
-        if 'organization' in config_data:
-            org_data = config_data['organization']
-            if 'company_name' in org_data:
-                config.organization.company_name = org_data['company_name']
-            if 'employee_count' in org_data:
-                config.organization.employee_count = org_data['employee_count']
-            if 'teams' in org_data:
-                config.organization.teams = org_data['teams']
-            if 'manager_count' in org_data:
-                config.organization.manager_count = org_data['manager_count']
-        
-        # Update content volumes
-        if 'content_volumes' in config_data:
-            vol_data = config_data['content_volumes']
-            if 'documents' in vol_data:
-                config.content_volumes.documents = vol_data['documents']
-            if 'chat_threads' in vol_data:
-                config.content_volumes.chat_threads = vol_data['chat_threads']
-        
-        # Update output settings
-        if 'output' in config_data:
-            out_data = config_data['output']
-            if 'output_dir' in out_data:
-                config.output.output_dir = out_data['output_dir']
-            if 'validation' in out_data:
-                config.output.validation = out_data['validation']
+        _hydrate(config.organization, config_data.get('organization', {}))
+        _hydrate(config.temporal, config_data.get('temporal', {}))
+        _hydrate(config.output, config_data.get('output', {}))
+        
+        # Content volumes may express min/max pairs as "<name>_range" lists (see to_dict)
+        vol_data = dict(config_data.get('content_volumes', {}))
+        for prefix in ('chat_messages', 'overlaps'):
+            range_value = vol_data.pop(f'{prefix}_range', None)
+            if range_value:
+                vol_data[f'{prefix}_min'], vol_data[f'{prefix}_max'] = range_value
+        _hydrate(config.content_volumes, vol_data)
+        
+        if 'demo_personas' in config_data:
+            config.demo_personas = config_data['demo_personas']
         
         return config
     
     def save_config(self, config: GenerationConfig, output_path: str) -> None:
         """Save configuration to YAML file."""
         config_dict = config.to_dict()
+        yaml, _, dumper = _yaml_codec()
         
         with open(output_path, 'w', encoding='utf-8') as f:
-            yaml.dump(config_dict, f, default_flow_style=False, indent=2)
+            yaml.dump(config_dict, f, Dumper=dumper, default_flow_style=False, indent=2)
     
     @property
     def config(self) -> GenerationConfig:
-        """Get current configuration, loading if necessary."""
-        if self._config is None:
-            self._config = self.load_config()
-        return self._config
\ No newline at end of file
+        """Get current configuration, loading it once even under concurrent access."""
+        config = self._config
+        if config is None:
+            with self._config_lock:
+                if self._config is None:
+                    self._config = self.load_config()
+                config = self._config
+        return config
\ No newline at end of file
@@ -1,20 +1,44 @@
 """Configuration settings and data classes."""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
 from typing import List, Dict, Any
 from datetime import datetime
 
 
-@dataclass
+# Immutable defaults; each config instance gets its own mutable copy
+_DEFAULT_TEAMS = ("Marketing", "Product", "Engineering", "Finance", "HR")
+_DEFAULT_TIMEZONES = ("America/Los_Angeles", "America/New_York", "Europe/London")
+
+
+@lru_cache(maxsize=32)
+def parse_config_date(value: str) -> datetime:
+    """Parse an ISO date string from the configuration, memoizing the result.
+    
+    Args:
+        value: ISO 8601 date or datetime string
+        
+    Returns:
+        Parsed datetime
+    """
+    return datetime.fromisoformat(value)
+
+
+def _section_to_dict(section: Any) -> Dict[str, Any]:
+    """Shallow-convert a config section dataclass to a dictionary of its fields."""
+    return {f.name: getattr(section, f.name) for f in fields(section)}
+
+
+@dataclass(slots=True)
 class OrganizationConfig:
     """Configuration for organizational structure."""
     company_name: str = "TechNova Inc"
     employee_count: int = 25
-    teams: List[str] = field(default_factory=lambda: ["Marketing", "Product", "Engineering", "Finance", "HR"])
+    teams: List[str] = field(default_factory=lambda: list(_DEFAULT_TEAMS))
     manager_count: int = 3
 
 
-@dataclass
+@dataclass(slots=True)
 class ContentVolumeConfig:
     """Configuration for content generation volumes."""
     documents: int = 160
@@ -29,20 +53,26 @@ class ContentVolumeConfig:
     overlaps_max: int = 25
 
 
-@dataclass
+@dataclass(slots=True)
 class TemporalConfig:
     """Configuration for temporal data generation."""
     start_date: str = "2024-01-01"
     end_date: str = "2025-10-24"
     business_hours: str = "09:00-17:00"
-    timezones: List[str] = field(default_factory=lambda: [
-        "America/Los_Angeles", 
-        "America/New_York", 
-        "Europe/London"
-    ])
+    timezones: List[str] = field(default_factory=lambda: list(_DEFAULT_TIMEZONES))
+
+    @property
+    def start_dt(self) -> datetime:
+        """Parsed start of the generation window."""
+        return parse_config_date(self.start_date)
+
+    @property
+    def end_dt(self) -> datetime:
+        """Parsed end of the generation window."""
+        return parse_config_date(self.end_date)
 
 
-@dataclass
+@dataclass(slots=True)
 class OutputConfig:
     """Configuration for output formatting and validation."""
     format: str = "jsonl"
@@ -52,7 +82,7 @@ class OutputConfig:
     output_dir: str = "technova_dataset"
 
 
-@dataclass
+@dataclass(slots=True)
 class GenerationConfig:
     """Main configuration class combining all settings."""
     organization: OrganizationConfig = field(default_factory=OrganizationConfig)
@@ -67,43 +97,37 @@ class GenerationConfig:
         {"name": "Priya Patel", "role": "New Hire", "team": "Product"}
     ])
 
+    @property
+    def persona_names(self) -> List[str]:
+        """Demo persona names, parallel to persona_roles and persona_teams."""
+        return [persona["name"] for persona in self.demo_personas]
+
+    @property
+    def persona_roles(self) -> List[str]:
+        """Demo persona roles, parallel to persona_names."""
+        return [persona["role"] for persona in self.demo_personas]
+
+    @property
+    def persona_teams(self) -> List[str]:
+        """Demo persona teams, parallel to persona_names."""
+        return [persona["team"] for persona in self.demo_personas]
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert configuration to dictionary."""
+        content_volumes = _section_to_dict(self.content_volumes)
+        content_volumes["chat_messages_range"] = [
+            content_volumes.pop("chat_messages_min"),
+            content_volumes.pop("chat_messages_max")
+        ]
+        content_volumes["overlaps_range"] = [
+            content_volumes.pop("overlaps_min"),
+            content_volumes.pop("overlaps_max")
+        ]
+        
         return {
-            "organization": {
-                "company_name": self.organization.company_name,
-                "employee_count": self.organization.employee_count,
-                "teams": self.organization.teams,
-                "manager_count": self.organization.manager_count
-            },
-            "content_volumes": {
-                "documents": self.content_volumes.documents,
-                "chat_threads": self.content_volumes.chat_threads,
-                "chat_messages_range": [
-                    self.content_volumes.chat_messages_min,
-                    self.content_volumes.chat_messages_max
-                ],
-                "meetings": self.content_volumes.meetings,
-                "weekly_briefs": self.content_volumes.weekly_briefs,
-                "knowledge_graph_edges": self.content_volumes.knowledge_graph_edges,
-                "topics": self.content_volumes.topics,
-                "overlaps_range": [
-                    self.content_volumes.overlaps_min,
-                    self.content_volumes.overlaps_max
-                ]
-            },
-            "temporal": {
-                "start_date": self.temporal.start_date,
-                "end_date": self.temporal.end_date,
-                "business_hours": self.temporal.business_hours,
-                "timezones": self.temporal.timezones
-            },
-            "output": {
-                "format": self.output.format,
-                "compression": self.output.compression,
-                "validation": self.output.validation,
-                "manifest": self.output.manifest,
-                "output_dir": self.output.output_dir
-            },
+            "organization": _section_to_dict(self.organization),
+            "content_volumes": content_volumes,
+            "temporal": _section_to_dict(self.temporal),
+            "output": _section_to_dict(self.output),
             "demo_personas": self.demo_personas
-        }
\ No newline at end of file
+        }
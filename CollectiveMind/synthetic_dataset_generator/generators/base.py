@@ -1,7 +1,7 @@
 """Base generator class providing common functionality."""
 
 from abc import ABC, abstractmethod
-from typing import Any, List, Dict, Optional
+from typing import Any, List, Dict, Optional, Protocol, runtime_checkable
 import random
 import string
 from datetime import datetime, timedelta
@@ -11,6 +11,24 @@ from ..config.settings import GenerationConfig
 from .context import ContextManager
 
 
+# Basic business vocabulary for generated text
+BUSINESS_WORDS = (
+    "analysis", "strategy", "implementation", "optimization", "performance",
+    "metrics", "insights", "collaboration", "efficiency", "innovation",
+    "customer", "market", "revenue", "growth", "engagement", "conversion",
+    "platform", "solution", "framework", "methodology", "approach",
+    "requirements", "objectives", "deliverables", "timeline", "resources"
+)
+
+
+@runtime_checkable
+class _SupportsToDict(Protocol):
+    """Generated entity that can be serialized for output."""
+    
+    def to_dict(self) -> dict:
+        ...
+
+
 class BaseGenerator(ABC):
     """Abstract base class for all data generators."""
     
@@ -24,6 +42,17 @@ class BaseGenerator(ABC):
         self.config = config
         self.context = context
         self.random = random.Random()  # Use seeded random for reproducibility
+        self._id_counter = 0  # Sequence for generate_id
+        
+        # Bound RNG methods so hot paths skip the attribute lookup on self.random
+        self._choice = self.random.choice
+        self._choices = self.random.choices
+        self._sample = self.random.sample
+        self._randint = self.random.randint
+        
+        # Configured generation window, parsed once for random_config_datetime
+        self._date_start = config.temporal.start_dt
+        self._date_span_seconds = int((config.temporal.end_dt - self._date_start).total_seconds())
     
     @abstractmethod
     def generate(self) -> List[Any]:
@@ -39,10 +68,10 @@ class BaseGenerator(ABC):
         Returns:
             Unique ID string
         """
-        # Use a combination of timestamp and random for uniqueness
-        timestamp = int(datetime.now().timestamp() * 1000) % 100000
+        # A per-generator sequence guarantees uniqueness without reading the clock
+        self._id_counter += 1
         random_part = self.random.randint(1000, 9999)
-        return f"{prefix}{timestamp}_{random_part}"
+        return f"{prefix}{self._id_counter}_{random_part}"
     
     def generate_simple_id(self, prefix: str, counter: int) -> str:
         """Generate a simple sequential ID.
@@ -65,7 +94,7 @@ class BaseGenerator(ABC):
         Returns:
             Randomly selected item
         """
-        return self.random.choice(items) if items else None
+        return self._choice(items) if items else None
     
     def random_choices(self, items: List[Any], k: int) -> List[Any]:
         """Select multiple random items from list.
@@ -77,10 +106,7 @@ class BaseGenerator(ABC):
         Returns:
             List of randomly selected items
         """
-        if not items:
-            return []
-        k = min(k, len(items))
-        return self.random.choices(items, k=k)
+        return self._choices(items, k=min(k, len(items))) if items else []
     
     def random_sample(self, items: List[Any], k: int) -> List[Any]:
         """Select unique random items from list.
@@ -92,10 +118,7 @@ class BaseGenerator(ABC):
         Returns:
             List of unique randomly selected items
         """
-        if not items:
-            return []
-        k = min(k, len(items))
-        return self.random.sample(items, k)
+        return self._sample(items, min(k, len(items))) if items else []
     
     def random_date_between(self, start_date: datetime, end_date: datetime) -> datetime:
         """Generate random datetime between two dates.
@@ -107,12 +130,17 @@ class BaseGenerator(ABC):
         Returns:
             Random datetime within range
         """
-        time_between = end_date - start_date
-        days_between = time_between.days
-        random_days = self.random.randrange(days_between)
-        random_seconds = self.random.randrange(24 * 60 * 60)
+        # A single draw over the whole span keeps the distribution uniform to the second
+        span_seconds = int((end_date - start_date).total_seconds())
+        return start_date + timedelta(seconds=self.random.randrange(span_seconds))
+    
+    def random_config_datetime(self) -> datetime:
+        """Generate random datetime within the configured generation window.
         
-        return start_date + timedelta(days=random_days, seconds=random_seconds)
+        Returns:
+            Random datetime between the configured start and end dates
+        """
+        return self._date_start + timedelta(seconds=self.random.randrange(self._date_span_seconds))
     
     def random_business_datetime(self, date: datetime, timezone: str = "America/Los_Angeles") -> datetime:
         """Generate random datetime during business hours.
@@ -160,56 +188,38 @@ class BaseGenerator(ABC):
         Returns:
             Generated text string
         """
-        # Basic business vocabulary
-        business_words = [
-            "analysis", "strategy", "implementation", "optimization", "performance",
-            "metrics", "insights", "collaboration", "efficiency", "innovation",
-            "customer", "market", "revenue", "growth", "engagement", "conversion",
-            "platform", "solution", "framework", "methodology", "approach",
-            "requirements", "objectives", "deliverables", "timeline", "resources"
-        ]
-        
         # Add topic keywords if provided
-        if topic_keywords:
-            business_words.extend(topic_keywords)
+        vocabulary = BUSINESS_WORDS + tuple(topic_keywords) if topic_keywords else BUSINESS_WORDS
         
         word_count = self.random.randint(min_words, max_words)
-        words = []
-        
-        for i in range(word_count):
-            if i == 0:
-                # Start with a capital letter
-                word = self.random_choice(business_words).capitalize()
-            else:
-                word = self.random_choice(business_words)
-            words.append(word)
-        
-        # Join words and add some basic sentence structure
-        text = " ".join(words)
+        words = self.random.choices(vocabulary, k=word_count)
         
-        # Add periods to make it look more like sentences
-        sentences = []
-        current_sentence = []
+        # Start with a capital letter
+        if words:
+            words[0] = words[0].capitalize()
         
-        for word in words:
-            current_sentence.append(word)
-            if len(current_sentence) >= self.random.randint(5, 12):
-                sentences.append(" ".join(current_sentence) + ".")
-                current_sentence = []
+        # Add periods to make it look more like sentences, marking sentence
+        # ends in place so the whole text is built by a single join
+        if words:
+            randint = self.random.randint
+            end = randint(5, 12)
+            while end < word_count:
+                words[end - 1] += "."
+                end += randint(5, 12)
+            words[-1] += "."
         
-        if current_sentence:
-            sentences.append(" ".join(current_sentence) + ".")
-        
-        return " ".join(sentences)
+        return " ".join(words)
     
     def set_seed(self, seed: int) -> None:
         """Set random seed for reproducible generation.
         
+        Only this generator's RNG is seeded; callers that also rely on the
+        global ``random`` module must seed it themselves.
+        
         Args:
             seed: Random seed value
         """
         self.random.seed(seed)
-        random.seed(seed)  # Also set global random seed
     
     def validate_generated_data(self, data: List[Any]) -> bool:
         """Validate generated data meets basic requirements.
@@ -223,13 +233,16 @@ class BaseGenerator(ABC):
         if not data:
             return False
         
-        # Check that all items have required methods/attributes
-        for item in data:
-            if hasattr(item, 'to_dict'):
-                try:
-                    item.to_dict()
-                except Exception:
-                    return False
+        # Generators produce homogeneous collections, so one protocol check covers all items
+        if not isinstance(data[0], _SupportsToDict):
+            return True
+        
+        # Check that all items serialize
+        try:
+            for item in data:
+                item.to_dict()
+        except Exception:
+            return False
         
         return True
     
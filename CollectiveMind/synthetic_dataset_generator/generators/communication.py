@@ -1,6 +1,8 @@
 """Communication generator for creating realistic chat threads and messages."""
 
 import random
+import re
+from itertools import accumulate, chain
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
 
@@ -10,6 +12,77 @@ from ..models.core import ChatThread, ChatMessage
 from ..config.settings import GenerationConfig
 
 
+# Gaps between consecutive messages, indexed by minutes
+_GAP_DELTAS = tuple(timedelta(minutes=minutes) for minutes in range(31))
+
+# Emotionally charged message templates by emotion and intensity
+_EMOTIONAL_TEMPLATES = {
+    "frustrated": {
+        "high": (
+            "This {topic} is completely unacceptable! We need to fix this NOW!",
+            "I can't believe {topic} happened again. This is the third time this month!",
+            "The {topic} is causing major issues. Why wasn't this prevented?",
+        ),
+        "medium": (
+            "Really frustrated with this {topic} situation.",
+            "The {topic} is becoming a real problem for our team.",
+            "We need to address the {topic} issue before it gets worse.",
+        )
+    },
+    "confused": {
+        "medium": (
+            "I'm really confused about the {topic} process. Can someone explain?",
+            "The {topic} documentation doesn't make sense to me.",
+            "Not sure how to handle this {topic} situation. Need guidance.",
+        ),
+        "low": (
+            "Quick question about {topic} - what's the standard approach?",
+            "Clarification needed on {topic} requirements.",
+            "Can someone help me understand the {topic} workflow?",
+        )
+    },
+    "urgent": {
+        "critical": (
+            "CRITICAL: {topic} needs immediate attention! All hands on deck!",
+            "URGENT: {topic} is affecting production systems!",
+            "EMERGENCY: {topic} - need response team NOW!",
+        ),
+        "high": (
+            "High priority: {topic} needs to be resolved today.",
+            "Urgent: {topic} is blocking other work.",
+            "Time sensitive: {topic} deadline is approaching fast.",
+        )
+    },
+    "calm": (
+        "Update on {topic}: situation is under control now.",
+        "Good news - the {topic} issue has been resolved.",
+        "Thanks everyone for helping with the {topic} situation.",
+    )
+}
+
+
+def _split_emotional_templates() -> Dict[Tuple[str, str], Tuple[Tuple[str, ...], ...]]:
+    """Flatten the emotional templates into pre-split templates per (emotion, intensity).
+    
+    Calm templates apply at any intensity; other emotions fall back to their
+    medium templates for intensities they don't define.
+    """
+    split_templates = {}
+    for emotion, by_intensity in _EMOTIONAL_TEMPLATES.items():
+        for intensity in ("low", "medium", "high", "critical"):
+            if isinstance(by_intensity, dict):
+                templates = by_intensity.get(intensity, by_intensity.get("medium", ()))
+            else:
+                templates = by_intensity
+            split_templates[(emotion, intensity)] = tuple(
+                tuple(template.split("{topic}")) for template in templates
+            )
+    return split_templates
+
+
+_EMOTIONAL_TEMPLATE_PARTS = _split_emotional_templates()
+
+
 class CommunicationGenerator(BaseGenerator):
     """Generates realistic chat threads and messages across teams."""
     
@@ -17,6 +90,17 @@ class CommunicationGenerator(BaseGenerator):
         """Initialize communication generator."""
         super().__init__(config, context)
         
+        # Channel name/tag builders by channel type, for _create_thread
+        self._channel_builders = {
+            "team-general": self._build_team_general_channel,
+            "project-specific": self._build_project_specific_channel,
+            "cross-team": self._build_cross_team_channel,
+            "random": self._build_random_channel
+        }
+        
+        # Config values read for every thread
+        self._teams = tuple(config.organization.teams)
+        
         # Channel types and patterns
         self.channel_types = {
             "team-general": {
@@ -55,54 +139,54 @@ class CommunicationGenerator(BaseGenerator):
         
         # Message templates by context
         self.message_templates = {
-            "standup": [
+            "standup": (
                 "Yesterday I worked on {topic}. Today I'm focusing on {topic}.",
                 "Completed {topic} review. Moving on to {topic} implementation.",
                 "Had some blockers with {topic}, but resolved them. Continuing with {topic}.",
                 "Finished {topic} analysis. Results look good. Next: {topic}."
-            ],
-            "question": [
+            ),
+            "question": (
                 "Has anyone worked on {topic} before? Need some guidance.",
                 "Quick question about {topic} - what's the best approach?",
                 "Stuck on {topic}. Any suggestions?",
                 "Anyone familiar with {topic}? Could use some help."
-            ],
-            "update": [
+            ),
+            "update": (
                 "Update on {topic}: we're making good progress.",
                 "FYI - {topic} is now complete and ready for review.",
                 "Status update: {topic} is 80% done, should finish by EOD.",
                 "Quick update: {topic} deployment went smoothly."
-            ],
-            "discussion": [
+            ),
+            "discussion": (
                 "What do you all think about the {topic} approach?",
                 "I've been analyzing {topic} and have some concerns.",
                 "Interesting findings from the {topic} data.",
                 "We should discuss the {topic} strategy in our next meeting."
-            ],
-            "urgent": [
+            ),
+            "urgent": (
                 "URGENT: Issue with {topic} - need immediate attention!",
                 "Critical: {topic} is down, investigating now.",
                 "Emergency: {topic} failure affecting customers.",
                 "High priority: {topic} needs to be fixed ASAP."
-            ],
-            "frustrated": [
+            ),
+            "frustrated": (
                 "This {topic} issue is really frustrating...",
                 "Why is {topic} so complicated? This shouldn't be this hard.",
                 "Spent all day on {topic} and still no progress 😤",
                 "The {topic} documentation is terrible, can't figure this out."
-            ],
-            "confused": [
+            ),
+            "confused": (
                 "I'm confused about the {topic} requirements.",
                 "Not sure I understand the {topic} approach correctly.",
                 "Can someone clarify the {topic} process?",
                 "The {topic} specs are unclear to me."
-            ],
-            "optimistic": [
+            ),
+            "optimistic": (
                 "Great progress on {topic} today! 🎉",
                 "The {topic} solution is working perfectly!",
                 "Excited about the {topic} results we're seeing.",
                 "This {topic} approach is going to be amazing!"
-            ]
+            )
         }
         
         # Emotion weights for different contexts
@@ -114,6 +198,43 @@ class CommunicationGenerator(BaseGenerator):
             "random": {"calm": 0.4, "optimistic": 0.4, "confused": 0.1, "frustrated": 0.1}
         }
         
+        # Cumulative weights for the fixed distributions, drawn from on every message
+        self._context_cdf_first = (("question", "update", "discussion"), (0.4, 0.7, 1.0))
+        self._context_cdf_rest = (("discussion", "update", "question", "standup"), (0.4, 0.7, 0.9, 1.0))
+        self._emotion_cdf = {
+            context: (tuple(weights), tuple(accumulate(weights.values())))
+            for context, weights in self.emotion_weights.items()
+        }
+        
+        # Templates pre-split around their {topic} placeholders, so filling one in is a str.join
+        self._split_templates = {
+            key: tuple(tuple(template.split("{topic}")) for template in templates)
+            for key, templates in self.message_templates.items()
+        }
+        
+        # Templates resolved per (context, emotion): strong emotions pick their own templates
+        emotions = {emotion for weights in self.emotion_weights.values() for emotion in weights}
+        self._template_for = {}
+        for context in self.message_templates:
+            for emotion in emotions:
+                key = emotion if emotion in ["urgent", "frustrated", "confused", "optimistic"] else context
+                self._template_for[(context, emotion)] = self._split_templates[key]
+        
+        # Common typos, matched as whole lowercase words so capitalized words are left alone
+        self._typo_patterns = [
+            (re.compile(rf"\b{original}\b"), typo)
+            for original, typo in [
+                ("the", "teh"),
+                ("and", "adn"),
+                ("you", "u"),
+                ("are", "r"),
+                ("to", "2"),
+                ("for", "4"),
+                ("be", "b"),
+                ("see", "c")
+            ]
+        ]
+        
         self.generated_threads: List[ChatThread] = []
         self.generated_messages: List[ChatMessage] = []
         self.thread_counter = 0
@@ -121,69 +242,96 @@ class CommunicationGenerator(BaseGenerator):
         
         # Track duplicate discussions for edge cases
         self.duplicate_topics = []
+        
+        # Snapshot of registered people, taken for the duration of generate()
+        self._people: Tuple[Any, ...] = ()
+        
+        # Sender weight of each person, memoized for the duration of generate()
+        self._sender_weights: Dict[str, float] = {}
+        
+        # Documents related to each (topic, team), memoized for the duration of generate()
+        self._related_docs: Dict[Tuple[str, str], List[Any]] = {}
     
     def generate(self) -> Tuple[List[ChatThread], List[ChatMessage]]:
         """Generate all chat threads and messages."""
         threads = []
-        all_messages = []
+        message_chunks = []  # Per-thread message lists, flattened once at the end
+        
+        # People don't change while chat is generated
+        self._people = tuple(self.context.people.values())
         
         # Generate different types of channels
+        chat_threads = self.config.content_volumes.chat_threads
+        max_participants = min(6, len(self._people))
         for channel_type, config in self.channel_types.items():
-            thread_count = int(self.config.content_volumes.chat_threads * config["frequency"])
+            thread_count = int(chat_threads * config["frequency"])
+            
+            # Draw the sizes of all threads of this type up front: 8-15 messages, 2-6 people
+            message_counts = self._choices(range(8, 16), k=thread_count)
+            participant_counts = self._choices(range(2, max_participants + 1), k=thread_count)
             
-            for _ in range(thread_count):
-                thread, messages = self._generate_thread_with_messages(channel_type)
+            for message_count, participant_count in zip(message_counts, participant_counts):
+                thread, messages = self._generate_thread_with_messages(
+                    channel_type, message_count, participant_count
+                )
                 threads.append(thread)
-                all_messages.extend(messages)
+                message_chunks.append(messages)
         
         # Generate duplicate discussion scenarios (25 as specified)
         duplicate_threads, duplicate_messages = self._generate_duplicate_discussions()
         threads.extend(duplicate_threads)
-        all_messages.extend(duplicate_messages)
+        message_chunks.append(duplicate_messages)
         
         # Generate emotionally charged threads (20 as specified)
         emotional_threads, emotional_messages = self._generate_emotional_threads()
         threads.extend(emotional_threads)
-        all_messages.extend(emotional_messages)
+        message_chunks.append(emotional_messages)
+        
+        all_messages = list(chain.from_iterable(message_chunks))
+        self._people = ()
+        self._related_docs = {}
+        self._sender_weights = {}
         
         # Register in context
-        for thread in threads:
-            self.context.register_entity('thread', thread.thread_id, thread)
+        self.context.register_entities('thread', ((thread.thread_id, thread) for thread in threads))
         
         self.generated_threads = threads
         self.generated_messages = all_messages
         
         return threads, all_messages
     
-    def _generate_thread_with_messages(self, channel_type: str) -> Tuple[ChatThread, List[ChatMessage]]:
-        """Generate a single thread with its messages."""
+    def _generate_thread_with_messages(self, channel_type: str, message_count: int,
+                                       participant_count: int) -> Tuple[ChatThread, List[ChatMessage]]:
+        """Generate a single thread with its messages.
+        
+        Args:
+            channel_type: Type of channel the thread belongs to
+            message_count: Number of messages to generate
+            participant_count: Number of people taking part
+            
+        Returns:
+            Tuple of (thread, messages)
+        """
         # Create thread
         thread = self._create_thread(channel_type)
-        
-        # Generate messages for thread
-        message_count = self.random.randint(8, 15)
         messages = []
         
-        # Select participants (2-6 people)
-        all_people = list(self.context.people.values())
-        participant_count = self.random.randint(2, min(6, len(all_people)))
-        participants = self.random.sample(all_people, participant_count)
+        # Select participants
+        participants = self._sample(self._people, participant_count)
         thread.participants = [p.person_id for p in participants]
         
-        # Generate conversation flow
-        current_time = self._generate_thread_start_time()
+        # Generate conversation flow (1-30 minutes between messages)
+        timestamps = self._message_timestamps(self._generate_thread_start_time(), 1, 30, message_count)
+        senders = self._select_message_senders(participants, message_count)
         
-        for i in range(message_count):
-            # Select sender (weighted toward more active participants)
-            sender = self._select_message_sender(participants, i)
-            
+        # Topics to talk about don't change over the thread
+        topic_pool = [*thread.topic_tags, *self.context.get_cross_team_themes()]
+        
+        create_message = self._create_message
+        add_message = messages.append
+        for i, sender in enumerate(senders):
             # Generate message
-            message = self._create_message(thread, sender, current_time, i, channel_type)
-            messages.append(message)
-            
-            # Advance time (1-30 minutes between messages)
-            time_gap = timedelta(minutes=self.random.randint(1, 30))
-            current_time += time_gap
+            add_message(create_message(thread, sender, timestamps[i], i, channel_type, topic_pool))
         
         return thread, messages
     
@@ -193,21 +341,8 @@ class CommunicationGenerator(BaseGenerator):
         thread_id = f"T_{self.thread_counter:03d}"
         
         # Generate channel name based on type
-        if channel_type == "team-general":
-            team = self.random_choice(self.config.organization.teams)
-            channel = f"{team.lower()}-general"
-            topic_tags = [team.lower(), "general"]
-        elif channel_type == "project-specific":
-            project = self.random_choice(self.project_names)
-            channel = f"project-{project}"
-            topic_tags = ["project", project]
-        elif channel_type == "cross-team":
-            topic = self.random_choice(self.cross_team_topics)
-            channel = f"cross-team-{topic}"
-            topic_tags = ["cross-team", topic]
-        else:  # random
-            channel = "random"
-            topic_tags = ["random", "casual"]
+        build_channel = self._channel_builders.get(channel_type, self._build_random_channel)
+        channel, topic_tags = build_channel()
         
         created_at = self._generate_thread_start_time()
         
@@ -219,8 +354,27 @@ class CommunicationGenerator(BaseGenerator):
             participants=[]  # Will be filled when generating messages
         )
     
+    def _build_team_general_channel(self) -> Tuple[str, List[str]]:
+        """Pick a team's general channel, returning (channel, topic_tags)."""
+        team = self.random_choice(self._teams).lower()
+        return f"{team}-general", [team, "general"]
+    
+    def _build_project_specific_channel(self) -> Tuple[str, List[str]]:
+        """Pick a project channel, returning (channel, topic_tags)."""
+        project = self.random_choice(self.project_names)
+        return f"project-{project}", ["project", project]
+    
+    def _build_cross_team_channel(self) -> Tuple[str, List[str]]:
+        """Pick a cross-team channel, returning (channel, topic_tags)."""
+        topic = self.random_choice(self.cross_team_topics)
+        return f"cross-team-{topic}", ["cross-team", topic]
+    
+    def _build_random_channel(self) -> Tuple[str, List[str]]:
+        """Return the casual channel as (channel, topic_tags)."""
+        return "random", ["random", "casual"]
+    
     def _create_message(self, thread: ChatThread, sender: Any, timestamp: datetime, 
-                      message_index: int, channel_type: str) -> ChatMessage:
+                      message_index: int, channel_type: str, topic_pool: List[str]) -> ChatMessage:
         """Create a single chat message."""
         self.message_counter += 1
         message_id = f"M_{self.message_counter:04d}"
@@ -230,28 +384,30 @@ class CommunicationGenerator(BaseGenerator):
         emotion = self._select_emotion(context)
         
         # Generate message text
-        text = self._generate_message_text(context, emotion, thread.topic_tags)
+        text = self._generate_message_text(context, emotion, topic_pool)
+        
+        roll = self.random.random
         
         # Add mentions (10% chance)
         mentions = []
-        if self.random.random() < 0.1 and len(thread.participants) > 1:
-            other_participants = [p for p in thread.participants if p != sender.person_id]
-            mentions = [self.random_choice(other_participants)]
+        participant_ids = thread.participants
+        if roll() < 0.1 and len(participant_ids) > 1:
+            # Pick uniformly among the other participants by skipping over the sender's slot
+            index = self._randint(0, len(participant_ids) - 2)
+            if index >= participant_ids.index(sender.person_id):
+                index += 1
+            mentions = [participant_ids[index]]
         
         # Add document references (15% chance)
         doc_refs = []
-        if self.random.random() < 0.15:
-            related_docs = self.context.get_related_documents(
-                self.random_choice(thread.topic_tags), 
-                sender.team, 
-                limit=1
-            )
-            if related_docs:
-                doc_refs = [related_docs[0].doc_id]
+        if roll() < 0.15:
+            related_doc = self._random_related_document(self.random_choice(thread.topic_tags), sender.team)
+            if related_doc:
+                doc_refs = [related_doc.doc_id]
         
         # Add action items (20% chance)
         action_items = []
-        if self.random.random() < 0.2:
+        if roll() < 0.2:
             action_items = self._generate_action_items(thread.topic_tags)
         
         return ChatMessage(
@@ -266,71 +422,72 @@ class CommunicationGenerator(BaseGenerator):
             action_items=action_items
         )
     
-    def _select_message_sender(self, participants: List[Any], message_index: int) -> Any:
-        """Select message sender with realistic participation patterns."""
+    def _random_related_document(self, topic: str, team: str) -> Optional[Any]:
+        """Pick a random document related to topic and team, if any."""
+        # Documents are all registered before chat is generated, so the candidates never change
+        key = (topic, team)
+        related_docs = self._related_docs.get(key)
+        if related_docs is None:
+            related_docs = self.context.get_related_documents(topic, team, limit=len(self.context.documents))
+            self._related_docs[key] = related_docs
+        
+        return self.random_choice(related_docs)
+    
+    def _select_message_senders(self, participants: List[Any], message_count: int) -> List[Any]:
+        """Select senders for all messages of a thread with realistic participation patterns."""
         # First message is random
-        if message_index == 0:
-            return self.random_choice(participants)
+        senders = [self.random_choice(participants)]
         
-        # Subsequent messages favor recent speakers and more senior people
-        weights = []
-        for participant in participants:
+        # Subsequent messages favor more senior people, sampled by bisecting the cumulative weights
+        cum_weights = list(accumulate(self._sender_weight(participant) for participant in participants))
+        senders.extend(self._choices(participants, cum_weights=cum_weights, k=message_count - 1))
+        return senders
+    
+    def _sender_weight(self, participant: Any) -> float:
+        """Get how likely a participant is to send a message, memoized per person."""
+        weight = self._sender_weights.get(participant.person_id)
+        if weight is None:
             weight = 1.0
             
             # Boost weight for managers
-            if "manager" in participant.role_title.lower() or "director" in participant.role_title.lower():
+            role = participant.role_title.lower()
+            if "manager" in role or "director" in role:
                 weight *= 1.5
             
             # Boost weight for people with longer tenure
             if participant.tenure_months > 24:
                 weight *= 1.2
             
-            weights.append(weight)
-        
-        return self.weighted_choice(participants, weights)
+            self._sender_weights[participant.person_id] = weight
+        return weight
     
     def _select_message_context(self, channel_type: str, message_index: int) -> str:
         """Select appropriate message context."""
-        if message_index == 0:
-            return self.weighted_choice(
-                ["question", "update", "discussion"],
-                [0.4, 0.3, 0.3]
-            )
-        else:
-            return self.weighted_choice(
-                ["discussion", "update", "question", "standup"],
-                [0.4, 0.3, 0.2, 0.1]
-            )
+        contexts, cum_weights = self._context_cdf_first if message_index == 0 else self._context_cdf_rest
+        return self._choices(contexts, cum_weights=cum_weights)[0]
     
     def _select_emotion(self, context: str) -> str:
         """Select emotion based on context."""
         if context == "urgent":
-            weights = self.emotion_weights["urgent"]
+            emotions, cum_weights = self._emotion_cdf["urgent"]
         elif context in ["standup", "update"]:
-            weights = self.emotion_weights["standup"]
+            emotions, cum_weights = self._emotion_cdf["standup"]
         else:
-            weights = self.emotion_weights["project"]
+            emotions, cum_weights = self._emotion_cdf["project"]
         
-        emotions = list(weights.keys())
-        emotion_weights = list(weights.values())
-        
-        return self.weighted_choice(emotions, emotion_weights)
+        return self._choices(emotions, cum_weights=cum_weights)[0]
     
-    def _generate_message_text(self, context: str, emotion: str, topic_tags: List[str]) -> str:
+    def _generate_message_text(self, context: str, emotion: str, topic_pool: List[str]) -> str:
         """Generate realistic message text."""
         # Select appropriate template
-        if emotion in ["urgent", "frustrated", "confused", "optimistic"]:
-            templates = self.message_templates.get(emotion, self.message_templates["discussion"])
-        else:
-            templates = self.message_templates.get(context, self.message_templates["discussion"])
-        
-        template = self.random_choice(templates)
+        templates = self._template_for.get((context, emotion), self._split_templates["discussion"])
+        template_parts = self._choice(templates)
         
         # Select topic for substitution
-        topic = self.random_choice(topic_tags + self.context.get_cross_team_themes())
+        topic = self.random_choice(topic_pool)
         
         # Generate message
-        message = template.format(topic=topic)
+        message = topic.join(template_parts)
         
         # Add casual elements occasionally
         if self.random.random() < 0.1:
@@ -348,23 +505,9 @@ class CommunicationGenerator(BaseGenerator):
     
     def _add_typos(self, text: str) -> str:
         """Add realistic typos to text."""
-        typo_patterns = [
-            ("the", "teh"),
-            ("and", "adn"),
-            ("you", "u"),
-            ("are", "r"),
-            ("to", "2"),
-            ("for", "4"),
-            ("be", "b"),
-            ("see", "c")
-        ]
-        
-        for original, typo in typo_patterns:
-            if self.random.random() < 0.3 and original in text.lower():
-                text = text.replace(original, typo, 1)
-                break
-        
-        return text
+        # Messages get at most one typo, so pick the pattern up front
+        pattern, typo = self.random_choice(self._typo_patterns)
+        return pattern.sub(typo, text, count=1)
     
     def _generate_action_items(self, topic_tags: List[str]) -> List[str]:
         """Generate realistic action items."""
@@ -401,7 +544,7 @@ class CommunicationGenerator(BaseGenerator):
         
         for topic in duplicate_topics:
             # Create two threads discussing the same topic
-            teams = self.random.sample(self.config.organization.teams, 2)
+            teams = self.random.sample(self._teams, 2)
             
             for team in teams:
                 thread = ChatThread(
@@ -417,19 +560,20 @@ class CommunicationGenerator(BaseGenerator):
                     participants = self.random.sample(team_people, min(3, len(team_people)))
                     thread.participants = [p.person_id for p in participants]
                     
-                    # Generate 3-5 messages
+                    # Generate 3-5 messages, drawing senders and timestamps up front
                     messages = []
-                    current_time = thread.created_at
+                    message_count = self.random.randint(3, 5)
+                    senders = self._choices(participants, k=message_count)
+                    timestamps = self._message_timestamps(thread.created_at, 5, 30, message_count)
+                    text = f"We need to analyze {topic} for our team. Has anyone started on this?"
                     
-                    for i in range(self.random.randint(3, 5)):
-                        sender = self.random_choice(participants)
-                        
+                    for i, sender in enumerate(senders):
                         message = ChatMessage(
                             message_id=f"M_DUP_{len(duplicate_messages) + len(messages) + 1:04d}",
                             thread_id=thread.thread_id,
                             sender_person_id=sender.person_id,
-                            timestamp=current_time,
-                            text=f"We need to analyze {topic} for our team. Has anyone started on this?",
+                            timestamp=timestamps[i],
+                            text=text,
                             emotions="confused",
                             mentions=[],
                             doc_refs=[],
@@ -437,7 +581,6 @@ class CommunicationGenerator(BaseGenerator):
                         )
                         
                         messages.append(message)
-                        current_time += timedelta(minutes=self.random.randint(5, 30))
                     
                     duplicate_threads.append(thread)
                     duplicate_messages.extend(messages)
@@ -472,34 +615,37 @@ class CommunicationGenerator(BaseGenerator):
             )
             
             # Select participants from multiple teams for cross-team issues
-            all_people = list(self.context.people.values())
-            participants = self.random.sample(all_people, self.random.randint(3, 6))
+            participants = self._sample(self._people, self.random.randint(3, 6))
             thread.participants = [p.person_id for p in participants]
             
-            # Generate emotionally charged messages
+            # Generate emotionally charged messages, drawing senders and timestamps up front
             messages = []
-            current_time = thread.created_at
+            message_count = self.random.randint(5, 10)
+            senders = self._choices(participants, k=message_count)
+            timestamps = self._message_timestamps(thread.created_at, 2, 15, message_count)
             
-            for j in range(self.random.randint(5, 10)):
-                sender = self.random_choice(participants)
-                
+            topic = scenario["topic"]
+            intensity = scenario["intensity"]
+            initial_emotion = scenario["emotion"]
+            escalated_emotion = "frustrated" if initial_emotion != "frustrated" else "urgent"
+            emotional_message_text = self._generate_emotional_message_text
+            
+            for j, sender in enumerate(senders):
                 # Escalate emotion over time
                 if j < 2:
-                    emotion = scenario["emotion"]
+                    emotion = initial_emotion
                 elif j < 5:
-                    emotion = "frustrated" if scenario["emotion"] != "frustrated" else "urgent"
+                    emotion = escalated_emotion
                 else:
                     emotion = "calm"  # Resolution phase
                 
-                message_text = self._generate_emotional_message_text(
-                    scenario["topic"], emotion, scenario["intensity"]
-                )
+                message_text = emotional_message_text(topic, emotion, intensity)
                 
                 message = ChatMessage(
                     message_id=f"M_EMO_{len(emotional_messages) + len(messages) + 1:04d}",
                     thread_id=thread.thread_id,
                     sender_person_id=sender.person_id,
-                    timestamp=current_time,
+                    timestamp=timestamps[j],
                     text=message_text,
                     emotions=emotion,
                     mentions=[],
@@ -508,7 +654,6 @@ class CommunicationGenerator(BaseGenerator):
                 )
                 
                 messages.append(message)
-                current_time += timedelta(minutes=self.random.randint(2, 15))
             
             emotional_threads.append(thread)
             emotional_messages.extend(messages)
@@ -517,67 +662,35 @@ class CommunicationGenerator(BaseGenerator):
     
     def _generate_emotional_message_text(self, topic: str, emotion: str, intensity: str) -> str:
         """Generate emotionally charged message text."""
-        templates = {
-            "frustrated": {
-                "high": [
-                    f"This {topic} is completely unacceptable! We need to fix this NOW!",
-                    f"I can't believe {topic} happened again. This is the third time this month!",
-                    f"The {topic} is causing major issues. Why wasn't this prevented?",
-                ],
-                "medium": [
-                    f"Really frustrated with this {topic} situation.",
-                    f"The {topic} is becoming a real problem for our team.",
-                    f"We need to address the {topic} issue before it gets worse.",
-                ]
-            },
-            "confused": {
-                "medium": [
-                    f"I'm really confused about the {topic} process. Can someone explain?",
-                    f"The {topic} documentation doesn't make sense to me.",
-                    f"Not sure how to handle this {topic} situation. Need guidance.",
-                ],
-                "low": [
-                    f"Quick question about {topic} - what's the standard approach?",
-                    f"Clarification needed on {topic} requirements.",
-                    f"Can someone help me understand the {topic} workflow?",
-                ]
-            },
-            "urgent": {
-                "critical": [
-                    f"CRITICAL: {topic} needs immediate attention! All hands on deck!",
-                    f"URGENT: {topic} is affecting production systems!",
-                    f"EMERGENCY: {topic} - need response team NOW!",
-                ],
-                "high": [
-                    f"High priority: {topic} needs to be resolved today.",
-                    f"Urgent: {topic} is blocking other work.",
-                    f"Time sensitive: {topic} deadline is approaching fast.",
-                ]
-            },
-            "calm": [
-                f"Update on {topic}: situation is under control now.",
-                f"Good news - the {topic} issue has been resolved.",
-                f"Thanks everyone for helping with the {topic} situation.",
-            ]
-        }
-        
-        if emotion == "calm":
-            return self.random_choice(templates["calm"])
-        else:
-            emotion_templates = templates.get(emotion, {})
-            intensity_templates = emotion_templates.get(intensity, emotion_templates.get("medium", []))
-            if intensity_templates:
-                return self.random_choice(intensity_templates)
+        templates = _EMOTIONAL_TEMPLATE_PARTS.get((emotion, intensity))
+        if templates:
+            return topic.join(self._choice(templates))
         
         return f"We need to discuss the {topic} situation."
     
+    def _message_timestamps(self, start_time: datetime, min_gap: int, max_gap: int,
+                            count: int) -> List[datetime]:
+        """Generate timestamps for consecutive messages in a thread.
+        
+        Args:
+            start_time: Timestamp of the first message
+            min_gap: Minimum minutes between messages
+            max_gap: Maximum minutes between messages
+            count: Number of messages
+            
+        Returns:
+            List of message timestamps, starting at start_time
+        """
+        gaps = self._choices(_GAP_DELTAS[min_gap:max_gap + 1], k=count - 1)
+        return list(accumulate(gaps, initial=start_time))
+    
     def _generate_thread_start_time(self) -> datetime:
         """Generate realistic thread start time during business hours."""
-        start_date = datetime.fromisoformat(self.config.temporal.start_date)
-        end_date = datetime.fromisoformat(self.config.temporal.end_date)
-        
-        base_time = self.random_date_between(start_date, end_date)
-        return self.random_business_datetime(base_time)
+        # Same distribution as random_date_between + random_business_datetime, in two draws
+        base_time = self.random_config_datetime()
+        business_minute = self.random.randrange(8 * 60)  # 9 AM to 5 PM
+        return base_time.replace(hour=9 + business_minute // 60, minute=business_minute % 60,
+                                 second=0, microsecond=0)
     
     def get_generation_progress(self) -> Dict[str, Any]:
         """Get progress information for communication generation."""
@@ -1,14 +1,61 @@
 """Context manager for maintaining shared state and references."""
 
-from typing import Dict, List, Optional, Any, Set
+from typing import AbstractSet, Dict, List, Optional, Any, Iterable, Set, Tuple
 from datetime import datetime, timedelta
 from collections import defaultdict
+from itertools import chain
+from operator import itemgetter
+from sys import intern
+import bisect
 import random
 
+from .sampling import reservoir_sample
 from ..models.core import Person, Document, Topic, ChatThread
 from ..config.settings import GenerationConfig
 
 
+# Role title keywords (lowercase) that mark a person as a manager
+MANAGER_KEYWORDS = ('manager', 'director')
+
+# Content themes and keywords by team
+_CONTENT_THEMES = {
+    "Marketing": (
+        "customer acquisition", "brand awareness", "campaign performance", 
+        "conversion rates", "market research", "competitive analysis",
+        "customer segmentation", "retention", "churn analysis", "pricing strategy"
+    ),
+    "Product": (
+        "user experience", "feature development", "product roadmap",
+        "user research", "A/B testing", "product metrics", "onboarding",
+        "user feedback", "feature adoption", "product strategy"
+    ),
+    "Engineering": (
+        "system architecture", "performance optimization", "scalability",
+        "technical debt", "code review", "deployment", "monitoring",
+        "security", "API design", "infrastructure", "bug fixes"
+    ),
+    "Finance": (
+        "revenue analysis", "cost optimization", "budget planning",
+        "financial forecasting", "risk assessment", "compliance",
+        "quarterly results", "expense tracking", "ROI analysis"
+    ),
+    "HR": (
+        "employee engagement", "talent acquisition", "performance management",
+        "training programs", "company culture", "policy updates",
+        "compensation", "benefits", "team building", "onboarding"
+    )
+}
+
+# Themes that span multiple teams
+_CROSS_TEAM_THEMES = (
+    "customer churn", "onboarding experience", "pricing strategy",
+    "user engagement", "performance metrics", "quarterly planning",
+    "hiring freeze", "policy changes", "system performance"
+)
+
+# Shared result for entities without cross-references
+_NO_REFERENCES: AbstractSet[str] = frozenset()
+
 class Timeline:
     """Manages temporal consistency across generated events."""
     
@@ -21,7 +68,14 @@ class Timeline:
         """
         self.start_date = start_date
         self.end_date = end_date
+        
+        # Events are appended as added and, if any arrived out of order, sorted (ties
+        # in insertion order) on the next query; their timestamps are kept in
+        # parallel lists for binary search
         self.events: List[Dict[str, Any]] = []
+        self._timestamps: List[datetime] = []
+        self._events_by_type: Dict[str, Tuple[List[datetime], List[Dict[str, Any]]]] = {}
+        self._is_sorted = True
     
     def add_event(self, event_type: str, entity_id: str, timestamp: datetime, 
                   metadata: Optional[Dict[str, Any]] = None) -> None:
@@ -40,6 +94,32 @@ class Timeline:
             'metadata': metadata or {}
         }
         self.events.append(event)
+        
+        # In-order events extend the indexes directly; anything else is sorted on the next query
+        if self._is_sorted and (not self._timestamps or timestamp >= self._timestamps[-1]):
+            self._timestamps.append(timestamp)
+            type_timestamps, type_events = self._events_by_type.setdefault(event_type, ([], []))
+            type_timestamps.append(timestamp)
+            type_events.append(event)
+        else:
+            self._is_sorted = False
+    
+    def _ensure_sorted(self) -> None:
+        """Sort events added since the last query and rebuild the search indexes."""
+        if self._is_sorted:
+            return
+        
+        # Stable, and close to linear when events mostly arrive in order
+        self.events.sort(key=itemgetter('timestamp'))
+        self._timestamps = [e['timestamp'] for e in self.events]
+        
+        self._events_by_type = {}
+        for event in self.events:
+            type_timestamps, type_events = self._events_by_type.setdefault(event['event_type'], ([], []))
+            type_timestamps.append(event['timestamp'])
+            type_events.append(event)
+        
+        self._is_sorted = True
     
     def get_events_before(self, timestamp: datetime, event_type: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get events that occurred before given timestamp.
@@ -51,10 +131,12 @@ class Timeline:
         Returns:
             List of events before timestamp
         """
-        events = [e for e in self.events if e['timestamp'] < timestamp]
+        self._ensure_sorted()
         if event_type:
-            events = [e for e in events if e['event_type'] == event_type]
-        return sorted(events, key=lambda x: x['timestamp'])
+            timestamps, events = self._events_by_type.get(event_type, ([], []))
+        else:
+            timestamps, events = self._timestamps, self.events
+        return events[:bisect.bisect_left(timestamps, timestamp)]
     
     def get_events_in_range(self, start: datetime, end: datetime) -> List[Dict[str, Any]]:
         """Get events within date range.
@@ -64,9 +146,12 @@ class Timeline:
             end: End of range
             
         Returns:
-            List of events in range
+            List of events in range, in chronological order
         """
-        return [e for e in self.events if start <= e['timestamp'] <= end]
+        self._ensure_sorted()
+        low = bisect.bisect_left(self._timestamps, start)
+        high = bisect.bisect_right(self._timestamps, end)
+        return self.events[low:high]
 
 
 class ValidationResult:
@@ -102,21 +187,43 @@ class ContextManager:
         self.people: Dict[str, Person] = {}
         self.documents: Dict[str, Document] = {}
         self.topics: Dict[str, Topic] = {}
+        self._topic_ids_by_name: Dict[str, str] = {}  # lowercase name or alias -> topic_id
         self.chat_threads: Dict[str, ChatThread] = {}
         
         # Team and role mappings
         self.teams = config.organization.teams
         self.people_by_team: Dict[str, List[str]] = defaultdict(list)
-        self.managers: List[str] = []
+        self.managers: List[str] = []  # In registration order
+        self._manager_ids: Set[str] = set()
+        self._team_managers: Dict[str, List[str]] = defaultdict(list)
+        self._role_titles: Dict[str, str] = {}  # person_id -> lowercase role title
+        self._role_matches: Dict[Tuple[Optional[str], str], List[Person]] = {}  # (team, role) -> people
+        self._people_version = 0  # Bumped on every person registration
+        self._people_snapshot: Tuple[int, Tuple[Person, ...]] = (-1, ())
         
         # Content and relationship tracking
-        self.document_tags: Dict[str, Set[str]] = defaultdict(set)  # tag -> doc_ids
+        self.document_tags: Dict[str, Set[str]] = {}  # tag -> doc_ids
+        self._team_documents: Dict[str, Set[str]] = defaultdict(set)  # team -> doc_ids
         self.topic_documents: Dict[str, Set[str]] = defaultdict(set)  # topic_id -> doc_ids
         self.cross_references: Dict[str, Set[str]] = defaultdict(set)  # entity_id -> related_entity_ids
         
+        # Registries and registration handlers by entity type
+        self._registries: Dict[str, Dict[str, Any]] = {
+            'person': self.people,
+            'document': self.documents,
+            'topic': self.topics,
+            'thread': self.chat_threads
+        }
+        self._register_handlers = {
+            'person': self._register_person,
+            'document': self._register_document,
+            'topic': self._register_topic,
+            'thread': self._register_thread
+        }
+        
         # Timeline management
-        start_date = datetime.fromisoformat(config.temporal.start_date)
-        end_date = datetime.fromisoformat(config.temporal.end_date)
+        start_date = config.temporal.start_dt
+        end_date = config.temporal.end_dt
         self.timeline = Timeline(start_date, end_date)
         
         # Content templates and themes
@@ -133,26 +240,81 @@ class ContextManager:
             entity_id: Unique identifier for entity
             entity: Entity object to register
         """
-        if entity_type == 'person':
-            self.people[entity_id] = entity
-            self.people_by_team[entity.team].append(entity_id)
-            
-            # Track managers
-            if 'manager' in entity.role_title.lower() or 'director' in entity.role_title.lower():
-                self.managers.append(entity_id)
-                
-        elif entity_type == 'document':
-            self.documents[entity_id] = entity
-            
-            # Index document tags
-            for tag in entity.tags:
-                self.document_tags[tag].add(entity_id)
-                
-        elif entity_type == 'topic':
-            self.topics[entity_id] = entity
-            
-        elif entity_type == 'thread':
-            self.chat_threads[entity_id] = entity
+        register = self._register_handlers.get(entity_type)
+        if register:
+            register(entity_id, entity)
+    
+    def register_entities(self, entity_type: str, entities: Iterable[Tuple[str, Any]]) -> None:
+        """Register many entities of one type, resolving the registry once.
+        
+        Args:
+            entity_type: Type of entities ('person', 'document', 'topic', 'thread')
+            entities: Pairs of (entity_id, entity) to register
+        """
+        register = self._register_handlers.get(entity_type)
+        if register:
+            for entity_id, entity in entities:
+                register(entity_id, entity)
+    
+    def _register_person(self, entity_id: str, entity: Person) -> None:
+        """Register a person and index it by team and manager status."""
+        if entity_id in self.people:
+            self._role_matches.clear()  # Re-registration: matches can't be patched incrementally
+        
+        # Interned so the many team comparisons and lookups hit the identity fast path
+        entity.team = intern(entity.team)
+        
+        self.people[entity_id] = entity
+        self.people_by_team[entity.team].append(entity_id)
+        self._people_version += 1
+        
+        title = intern(entity.role_title.lower())
+        self._role_titles[entity_id] = title
+        
+        # Extend the memoized role-filter matches in place
+        for (team, role_filter), matches in self._role_matches.items():
+            if (team is None or team == entity.team) and role_filter in title:
+                matches.append(entity)
+        
+        # Track managers
+        if any(keyword in title for keyword in MANAGER_KEYWORDS):
+            self.managers.append(entity_id)
+            self._manager_ids.add(entity_id)
+            self._team_managers[entity.team].append(entity_id)
+    
+    def _register_document(self, entity_id: str, entity: Document) -> None:
+        """Register a document and index it by team and tags."""
+        self.documents[entity_id] = entity
+        
+        # Intern team and tags, which are shared by many documents and used as index keys
+        entity.team = intern(entity.team)
+        entity.tags[:] = map(intern, entity.tags)
+        
+        # Index document team and tags
+        self._team_documents[entity.team].add(entity_id)
+        document_tags = self.document_tags
+        for tag in entity.tags:
+            doc_ids = document_tags.get(tag)
+            if doc_ids is None:
+                doc_ids = document_tags[tag] = set()
+            doc_ids.add(entity_id)
+    
+    def _register_topic(self, entity_id: str, entity: Topic) -> None:
+        """Register a topic and index it by name and aliases."""
+        self.topics[entity_id] = entity
+        
+        # Index name and aliases; the first topic registered under a name keeps it
+        self._topic_ids_by_name.setdefault(entity.name.lower(), entity_id)
+        for alias in entity.aliases:
+            self._topic_ids_by_name.setdefault(alias.lower(), entity_id)
+    
+    def _register_thread(self, entity_id: str, entity: ChatThread) -> None:
+        """Register a chat thread."""
+        self.chat_threads[entity_id] = entity
+    
+    def is_manager(self, person_id: str) -> bool:
+        """Check whether a registered person holds a manager role."""
+        return person_id in self._manager_ids
     
     def get_random_person(self, team: Optional[str] = None, role_filter: Optional[str] = None) -> Optional[Person]:
         """Get random person, optionally filtered by team or role.
@@ -164,16 +326,29 @@ class ContextManager:
         Returns:
             Random person matching criteria
         """
-        candidates = list(self.people.values())
-        
-        if team:
-            candidates = [p for p in candidates if p.team == team]
+        # Team and manager filters are served straight from the registration indexes
+        if role_filter and role_filter.lower() == 'manager':
+            candidate_ids = self._team_managers.get(team, []) if team else self.managers
+            return self.people[self.random.choice(candidate_ids)] if candidate_ids else None
         
         if role_filter:
-            if role_filter.lower() == 'manager':
-                candidates = [p for p in candidates if p.person_id in self.managers]
-            else:
-                candidates = [p for p in candidates if role_filter.lower() in p.role_title.lower()]
+            # Role matches are remembered and extended as people are registered
+            key = (team or None, role_filter.lower())
+            candidates = self._role_matches.get(key)
+            if candidates is None:
+                role_filter = key[1]
+                candidates = [
+                    p for p in (self.get_people_by_team(team) if team else self.people.values())
+                    if role_filter in self._role_titles[p.person_id]
+                ]
+                self._role_matches[key] = candidates
+        elif team:
+            candidates = self.get_people_by_team(team)
+        else:
+            # Reuse the tuple of all people until someone new is registered
+            if self._people_snapshot[0] != self._people_version:
+                self._people_snapshot = (self._people_version, tuple(self.people.values()))
+            candidates = self._people_snapshot[1]
         
         return self.random.choice(candidates) if candidates else None
     
@@ -201,19 +376,23 @@ class ContextManager:
             List of related documents
         """
         # Find documents with matching tags
-        doc_ids = self.document_tags.get(topic, set())
+        tagged_ids = self.document_tags.get(topic, set())
+        doc_ids: Iterable[str] = tagged_ids
         
-        # Also check topic-document mappings
+        # Also check topic-document mappings, skipping documents already found by tag
         topic_obj = self._find_topic_by_name(topic)
         if topic_obj:
-            doc_ids.update(self.topic_documents.get(topic_obj.topic_id, set()))
-        
-        documents = [self.documents[doc_id] for doc_id in doc_ids if doc_id in self.documents]
+            topic_ids = self.topic_documents.get(topic_obj.topic_id, ())
+            doc_ids = chain(tagged_ids, (doc_id for doc_id in topic_ids if doc_id not in tagged_ids))
         
-        if team:
-            documents = [doc for doc in documents if doc.team == team]
+        team_ids = self._team_documents.get(team, set()) if team else None
+        documents = (
+            self.documents[doc_id] for doc_id in doc_ids
+            if doc_id in self.documents and (team_ids is None or doc_id in team_ids)
+        )
         
-        return self.random.sample(documents, min(limit, len(documents)))
+        # Sample while streaming, so memory stays proportional to the limit
+        return reservoir_sample(documents, limit, self.random)
     
     def add_cross_reference(self, entity_id: str, related_entity_id: str) -> None:
         """Add cross-reference between entities.
@@ -225,16 +404,16 @@ class ContextManager:
         self.cross_references[entity_id].add(related_entity_id)
         self.cross_references[related_entity_id].add(entity_id)
     
-    def get_cross_references(self, entity_id: str) -> Set[str]:
+    def get_cross_references(self, entity_id: str) -> AbstractSet[str]:
         """Get entities cross-referenced with given entity.
         
         Args:
             entity_id: Entity ID to look up
             
         Returns:
-            Set of related entity IDs
+            Set of related entity IDs (read-only)
         """
-        return self.cross_references.get(entity_id, set())
+        return self.cross_references.get(entity_id, _NO_REFERENCES)
     
     def ensure_referential_integrity(self) -> ValidationResult:
         """Validate referential integrity across all entities.
@@ -244,23 +423,38 @@ class ContextManager:
         """
         result = ValidationResult()
         
+        # Find dangling IDs with set differences first; records are only revisited
+        # (in registration order) to report errors when something is missing
+        people = self.people.values()
+        documents = self.documents.values()
+        
         # Validate person references
-        for person in self.people.values():
-            if person.manager_id and person.manager_id not in self.people:
-                result.add_error(f"Person {person.person_id} has invalid manager_id: {person.manager_id}")
+        missing_managers = {p.manager_id for p in people if p.manager_id} - self.people.keys()
+        if missing_managers:
+            for person in people:
+                if person.manager_id in missing_managers:
+                    result.add_error(f"Person {person.person_id} has invalid manager_id: {person.manager_id}")
         
         # Validate document references
-        for document in self.documents.values():
-            if document.author_person_id not in self.people:
-                result.add_error(f"Document {document.doc_id} has invalid author_person_id: {document.author_person_id}")
-            
-            for co_author in document.co_authors:
-                if co_author not in self.people:
-                    result.add_error(f"Document {document.doc_id} has invalid co_author: {co_author}")
-            
-            for related_doc in document.related_doc_ids:
-                if related_doc not in self.documents:
-                    result.add_warning(f"Document {document.doc_id} references non-existent document: {related_doc}")
+        referenced_people = {d.author_person_id for d in documents}
+        referenced_people.update(chain.from_iterable(d.co_authors for d in documents))
+        missing_people = referenced_people - self.people.keys()
+        
+        referenced_docs = set(chain.from_iterable(d.related_doc_ids for d in documents))
+        missing_docs = referenced_docs - self.documents.keys()
+        
+        if missing_people or missing_docs:
+            for document in documents:
+                if document.author_person_id in missing_people:
+                    result.add_error(f"Document {document.doc_id} has invalid author_person_id: {document.author_person_id}")
+                
+                for co_author in document.co_authors:
+                    if co_author in missing_people:
+                        result.add_error(f"Document {document.doc_id} has invalid co_author: {co_author}")
+                
+                for related_doc in document.related_doc_ids:
+                    if related_doc in missing_docs:
+                        result.add_warning(f"Document {document.doc_id} references non-existent document: {related_doc}")
         
         return result
     
@@ -273,48 +467,18 @@ class ContextManager:
         Returns:
             Topic object if found
         """
-        for topic in self.topics.values():
-            if topic.name.lower() == name.lower():
-                return topic
-            if name.lower() in [alias.lower() for alias in topic.aliases]:
-                return topic
-        return None
+        topic_id = self._topic_ids_by_name.get(name.lower())
+        return self.topics.get(topic_id) if topic_id else None
     
-    def _initialize_content_themes(self) -> Dict[str, List[str]]:
+    def _initialize_content_themes(self) -> Dict[str, Tuple[str, ...]]:
         """Initialize content themes and keywords by team.
         
         Returns:
             Dictionary mapping teams to their content themes
         """
-        return {
-            "Marketing": [
-                "customer acquisition", "brand awareness", "campaign performance", 
-                "conversion rates", "market research", "competitive analysis",
-                "customer segmentation", "retention", "churn analysis", "pricing strategy"
-            ],
-            "Product": [
-                "user experience", "feature development", "product roadmap",
-                "user research", "A/B testing", "product metrics", "onboarding",
-                "user feedback", "feature adoption", "product strategy"
-            ],
-            "Engineering": [
-                "system architecture", "performance optimization", "scalability",
-                "technical debt", "code review", "deployment", "monitoring",
-                "security", "API design", "infrastructure", "bug fixes"
-            ],
-            "Finance": [
-                "revenue analysis", "cost optimization", "budget planning",
-                "financial forecasting", "risk assessment", "compliance",
-                "quarterly results", "expense tracking", "ROI analysis"
-            ],
-            "HR": [
-                "employee engagement", "talent acquisition", "performance management",
-                "training programs", "company culture", "policy updates",
-                "compensation", "benefits", "team building", "onboarding"
-            ]
-        }
+        return dict(_CONTENT_THEMES)
     
-    def get_content_themes(self, team: str) -> List[str]:
+    def get_content_themes(self, team: str) -> Tuple[str, ...]:
         """Get content themes for a specific team.
         
         Args:
@@ -323,19 +487,15 @@ class ContextManager:
         Returns:
             List of content themes for the team
         """
-        return self.content_themes.get(team, [])
+        return self.content_themes.get(team, ())
     
-    def get_cross_team_themes(self) -> List[str]:
+    def get_cross_team_themes(self) -> Tuple[str, ...]:
         """Get themes that span multiple teams.
         
         Returns:
-            List of cross-team themes
+            Tuple of cross-team themes
         """
-        return [
-            "customer churn", "onboarding experience", "pricing strategy",
-            "user engagement", "performance metrics", "quarterly planning",
-            "hiring freeze", "policy changes", "system performance"
-        ]
+        return _CROSS_TEAM_THEMES
     
     def get_entity_count(self, entity_type: str) -> int:
         """Get count of registered entities by type.
@@ -346,15 +506,7 @@ class ContextManager:
         Returns:
             Number of entities of that type
         """
-        if entity_type == 'person':
-            return len(self.people)
-        elif entity_type == 'document':
-            return len(self.documents)
-        elif entity_type == 'topic':
-            return len(self.topics)
-        elif entity_type == 'thread':
-            return len(self.chat_threads)
-        return 0
+        return len(self._registries.get(entity_type, ()))
     
     def get_all_entity_ids(self, entity_type: str) -> List[str]:
         """Get all entity IDs of a specific type.
@@ -365,12 +517,4 @@ class ContextManager:
         Returns:
             List of entity IDs
         """
-        if entity_type == 'person':
-            return list(self.people.keys())
-        elif entity_type == 'document':
-            return list(self.documents.keys())
-        elif entity_type == 'topic':
-            return list(self.topics.keys())
-        elif entity_type == 'thread':
-            return list(self.chat_threads.keys())
-        return []
\ No newline at end of file
+        return list(self._registries.get(entity_type, ()))
\ No newline at end of file
@@ -1,15 +1,33 @@
 """Document generator for creating realistic organizational documents."""
 
 import random
-from typing import List, Dict, Any, Optional
+import re
+from collections import Counter, defaultdict
+from itertools import product
+from sys import intern
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
 
 from .base import BaseGenerator
 from .context import ContextManager
+from .sampling import reservoir_sample
 from ..models.core import Document
 from ..config.settings import GenerationConfig
 
 
+def _compile_title_pattern(pattern: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Split a title pattern into its literal text and the field names between them.
+    
+    Args:
+        pattern: Title pattern with {field} placeholders
+        
+    Returns:
+        Tuple of (literals, field names), with one more literal than field names
+    """
+    parts = re.split(r"\{(\w+)\}", pattern)
+    return tuple(parts[0::2]), tuple(parts[1::2])
+
+
 class DocumentGenerator(BaseGenerator):
     """Generates diverse document types with realistic content across teams."""
     
@@ -221,6 +239,9 @@ class DocumentGenerator(BaseGenerator):
             "Market Expansion", "Customer Feedback", "Product Roadmap"
         ]
         
+        # Lower-cased words of each topic, used as document tags
+        self._topic_tokens = {topic: tuple(topic.lower().split()) for topic in self.common_topics}
+        
         # Language options for non-English documents
         self.languages = [
             {"code": "es", "name": "Spanish"},
@@ -230,18 +251,74 @@ class DocumentGenerator(BaseGenerator):
             {"code": "pt", "name": "Portuguese"}
         ]
         
+        # Language code with the title and content markers of a converted document
+        self._language_markers = tuple(
+            (language["code"], f"[{language['name']}] ", f"[Content in {language['name']}]\n\n")
+            for language in self.languages
+        )
+        
+        # Per-team template data flattened into parallel tuples indexed by template:
+        # team -> (template names, pre-split title patterns, content themes, theme tag words)
+        self._team_packs = {
+            team: self._pack_templates(team_templates)
+            for team, team_templates in self.document_templates.items()
+        }
+        self._default_pack = self._pack_templates({})
+        
+        # Status, visibility and confidentiality weights are multiples of 0.1, so each
+        # is expanded into ten equally likely slots; every (status, visibility,
+        # confidentiality) triple in their product is then equally likely, and one
+        # uniform pick from the table draws all three labels with exact weights
+        statuses = ("draft",) * 2 + ("final",) * 8
+        visibilities = ("public",) + ("internal",) * 8 + ("restricted",)
+        confidentialities = ("low",) * 3 + ("medium",) * 6 + ("high",)
+        self._label_table = tuple(product(statuses, visibilities, confidentialities))
+        
+        # Team content themes from the context, fetched once per team
+        self._theme_cache: Dict[str, tuple] = {}
+        
         self.generated_documents: List[Document] = []
         self.doc_counter = 0
     
+    @staticmethod
+    def _pack_templates(team_templates: Dict[str, Dict[str, Any]]) -> Tuple[tuple, tuple, tuple, tuple]:
+        """Flatten a team's templates into parallel tuples of names, titles and themes.
+        
+        Args:
+            team_templates: Templates of one team keyed by template name
+            
+        Returns:
+            Tuple of (template names, title patterns, content themes, theme tag words),
+            where the tag words are the words of each template's first two themes
+        """
+        templates = team_templates or {"General": {}}
+        content_themes = tuple(tuple(template.get("content_themes", ["general analysis"]))
+                               for template in templates.values())
+        return (
+            tuple(templates),
+            tuple(
+                tuple(_compile_title_pattern(pattern)
+                      for pattern in template.get("title_patterns", ["{topic} Document"]))
+                for template in templates.values()
+            ),
+            content_themes,
+            tuple(tuple(word for theme in themes[:2] for word in theme.replace("_", " ").split())
+                  for themes in content_themes),
+        )
+    
     def generate(self) -> List[Document]:
         """Generate all documents across teams."""
         documents = []
         
+        # Team names are interned so every document shares one string per team
+        teams = [intern(team) for team in self.config.organization.teams]
+        
         # Calculate documents per team
-        docs_per_team = self.config.content_volumes.documents // len(self.config.organization.teams)
-        remaining_docs = self.config.content_volumes.documents % len(self.config.organization.teams)
+        docs_per_team = self.config.content_volumes.documents // len(teams)
+        remaining_docs = self.config.content_volumes.documents % len(teams)
         
-        for i, team in enumerate(self.config.organization.teams):
+        # Teams are generated in sequence so the shared counter numbers document ids consecutively
+        for i, team in enumerate(teams):
             team_doc_count = docs_per_team
             if i < remaining_docs:
                 team_doc_count += 1
@@ -256,8 +333,7 @@ class DocumentGenerator(BaseGenerator):
         self._add_document_relationships(documents)
         
         # Register documents in context
-        for doc in documents:
-            self.context.register_entity('document', doc.doc_id, doc)
+        self.context.register_entities('document', ((doc.doc_id, doc) for doc in documents))
         
         self.generated_documents = documents
         return documents
@@ -265,72 +341,104 @@ class DocumentGenerator(BaseGenerator):
     def _generate_team_documents(self, team: str, count: int) -> List[Document]:
         """Generate documents for a specific team."""
         documents = []
-        team_people = self.context.get_people_by_team(team)
+        team_people = tuple(self.context.get_people_by_team(team))
         
         if not team_people:
             return documents
         
-        team_templates = self.document_templates.get(team, {})
-        template_names = list(team_templates.keys())
+        template_names, title_patterns, content_themes, theme_words = \
+            self._team_packs.get(team, self._default_pack)
         
-        for i in range(count):
-            # Select document template
-            template_name = self.random_choice(template_names) if template_names else "General"
-            template = team_templates.get(template_name, {})
-            
-            # Generate document
-            doc = self._create_single_document(team, template, i, team_people)
+        # Draw every document's template and topic up front
+        template_indices = self._choices(range(len(template_names)), k=count)
+        topics = self._choices(self.common_topics, k=count)
+        
+        # Draw title patterns in one batch per template used
+        title_draws = {
+            k: iter(self._choices(title_patterns[k], k=template_count))
+            for k, template_count in Counter(template_indices).items()
+        }
+        
+        # Draw team tags and (status, visibility, confidentiality) labels in one batch each
+        team_themes = self._theme_cache.get(team)
+        if team_themes is None:
+            team_themes = self._theme_cache[team] = tuple(
+                theme.replace(" ", "_") for theme in self.context.get_content_themes(team) or ())
+        team_tags = self._choices(team_themes, k=count) if team_themes else [None] * count
+        labels = self._choices(self._label_table, k=count)
+        
+        for i, (k, topic, team_tag, doc_labels) in enumerate(zip(template_indices, topics,
+                                                                 team_tags, labels)):
+            doc = self._create_single_document(team, next(title_draws[k]), content_themes[k],
+                                               theme_words[k], team_tag, doc_labels,
+                                               i, team_people, topic)
             documents.append(doc)
         
         return documents
     
-    def _create_single_document(self, team: str, template: Dict[str, Any], 
-                              index: int, team_people: List[Any]) -> Document:
-        """Create a single document."""
+    def _create_single_document(self, team: str, title_pattern: tuple, content_themes: tuple,
+                              theme_words: Tuple[str, ...], team_tag: Optional[str],
+                              labels: Tuple[str, str, str], index: int,
+                              team_people: Tuple[Any, ...], topic: str) -> Document:
+        """Create a single document about the given topic.
+        
+        Args:
+            team: Team owning the document
+            title_pattern: Pre-split title pattern drawn from the chosen template
+            content_themes: Content themes of the chosen template
+            theme_words: Tag words of the chosen template's leading themes
+            team_tag: Team theme tag drawn for the document, if the team has themes
+            labels: Drawn (status, visibility, confidentiality) of the document
+            index: Position of the document within its team
+            team_people: Members of the team
+            topic: Document topic
+            
+        Returns:
+            Generated document
+        """
         # Generate document ID using counter
         self.doc_counter += 1
         doc_id = f"DOC_{self.doc_counter:03d}"
         
-        # Select topic
-        topic = self.random_choice(self.common_topics)
-        
         # Generate title
-        title_patterns = template.get("title_patterns", ["{topic} Document"])
-        title_pattern = self.random_choice(title_patterns)
-        title = title_pattern.format(topic=topic, quarter=self.random.randint(1, 4))
+        literals, field_names = title_pattern
+        if field_names == ("topic",):
+            title = topic.join(literals)
+        else:
+            values = {"topic": topic, "quarter": str(self.random.randint(1, 4))}
+            title = literals[0] + "".join(values[name] + literal
+                                          for name, literal in zip(field_names, literals[1:]))
         
         # Generate content
-        content_themes = template.get("content_themes", ["general analysis"])
         content = self._generate_document_content(topic, content_themes)
         
-        # Select author and co-authors
-        author = self.random_choice(team_people)
+        # Select author and co-authors by index, skipping over the author's slot
+        team_size = len(team_people)
+        author_index = self.random.randrange(team_size)
+        author = team_people[author_index]
         co_authors = []
-        if self.random.random() < 0.3:  # 30% chance of co-authors
-            potential_coauthors = [p for p in team_people if p.person_id != author.person_id]
-            if potential_coauthors:
-                co_author_count = self.random.randint(1, min(2, len(potential_coauthors)))
-                co_authors = [p.person_id for p in self.random.sample(potential_coauthors, co_author_count)]
+        if self.random.random() < 0.3 and team_size > 1:  # 30% chance of co-authors
+            randrange = self.random.randrange
+            first = randrange(team_size - 1)
+            first += first >= author_index
+            co_authors.append(team_people[first].person_id)
+            
+            # Optional second co-author, drawn from the slots left after the first two
+            if team_size > 2 and randrange(2):
+                low, high = sorted((author_index, first))
+                second = randrange(team_size - 2)
+                second += second >= low
+                second += second >= high
+                co_authors.append(team_people[second].person_id)
         
         # Generate tags
-        tags = self._generate_document_tags(topic, content_themes, team)
+        tags = self._generate_document_tags(topic, theme_words, team_tag)
         
         # Generate timestamps
         created_at = self._generate_document_timestamp()
         updated_at = created_at + timedelta(days=self.random.randint(0, 30))
         
-        # Determine status and visibility
-        status = self.weighted_choice(["draft", "final"], [0.2, 0.8])
-        visibility = self.weighted_choice(
-            ["public", "internal", "restricted"], 
-            [0.1, 0.8, 0.1]
-        )
-        
-        # Determine confidentiality
-        confidentiality = self.weighted_choice(
-            ["low", "medium", "high"],
-            [0.3, 0.6, 0.1]
-        )
+        status, visibility, confidentiality = labels
         
         return Document(
             doc_id=doc_id,
@@ -351,56 +459,66 @@ class DocumentGenerator(BaseGenerator):
     
     def _generate_document_content(self, topic: str, themes: List[str]) -> str:
         """Generate realistic document content."""
-        # Create content sections based on themes
-        sections = []
+        # Create content sections based on themes, as one flat list of
+        # heading and body pieces joined once at the end. One keyword list is
+        # reused for every section: generate_realistic_text copies the keywords
+        # into its vocabulary and does not keep the list.
+        keywords = [topic.lower()]
         
         # Introduction
-        intro_keywords = [topic.lower()] + themes[:2]
-        intro = self.generate_realistic_text(20, 40, intro_keywords)
-        sections.append(f"## Overview\n\n{intro}")
+        keywords[1:] = themes[:2]
+        intro = self.generate_realistic_text(20, 40, keywords)
+        parts = ["## Overview\n\n", intro]
         
         # Main sections
         for theme in themes[:3]:
-            section_keywords = [topic.lower(), theme]
-            section_content = self.generate_realistic_text(30, 60, section_keywords)
+            keywords[1:] = (theme,)
+            section_content = self.generate_realistic_text(30, 60, keywords)
             section_title = theme.replace("_", " ").title()
-            sections.append(f"## {section_title}\n\n{section_content}")
+            parts += ("\n\n## ", section_title, "\n\n", section_content)
         
         # Conclusion
-        conclusion_keywords = [topic.lower(), "recommendations", "next steps"]
-        conclusion = self.generate_realistic_text(15, 30, conclusion_keywords)
-        sections.append(f"## Conclusion\n\n{conclusion}")
+        keywords[1:] = ("recommendations", "next steps")
+        conclusion = self.generate_realistic_text(15, 30, keywords)
+        parts += ("\n\n## Conclusion\n\n", conclusion)
         
-        return "\n\n".join(sections)
+        return "".join(parts)
     
-    def _generate_document_tags(self, topic: str, themes: List[str], team: str) -> List[str]:
-        """Generate relevant tags for document."""
-        tags = []
-        
-        # Add topic-based tags
-        topic_words = topic.lower().split()
-        tags.extend(topic_words)
-        
-        # Add theme-based tags
-        for theme in themes[:2]:
-            theme_words = theme.replace("_", " ").split()
-            tags.extend(theme_words)
+    def _generate_document_tags(self, topic: str, theme_words: Tuple[str, ...],
+                                team_tag: Optional[str]) -> List[str]:
+        """Generate relevant tags for document.
+        
+        Args:
+            topic: Document topic
+            theme_words: Pre-split words of the template's leading themes
+            team_tag: Team theme tag, if the team has themes
+            
+        Returns:
+            Up to 5 distinct tags
+        """
+        # Add topic-based and theme-based tags
+        tags = [*self._topic_tokens[topic], *theme_words]
         
         # Add team-specific tags
-        team_themes = self.context.get_content_themes(team)
-        if team_themes:
-            tags.append(self.random_choice(team_themes).replace(" ", "_"))
-        
-        # Remove duplicates and limit count
-        unique_tags = list(set(tags))
-        return self.random.sample(unique_tags, min(5, len(unique_tags)))
+        if team_tag is not None:
+            tags.append(team_tag)
+        
+        # Remove duplicates in insertion order (set order varies with string hashing)
+        unique_tags = list(dict.fromkeys(tags))
+        
+        # Partial Fisher-Yates shuffle to pick up to 5
+        n = len(unique_tags)
+        k = min(5, n)
+        randrange = self.random.randrange
+        for i in range(k):
+            j = randrange(i, n)
+            unique_tags[i], unique_tags[j] = unique_tags[j], unique_tags[i]
+        del unique_tags[k:]
+        return unique_tags
     
     def _generate_document_timestamp(self) -> datetime:
         """Generate realistic document creation timestamp."""
-        start_date = datetime.fromisoformat(self.config.temporal.start_date)
-        end_date = datetime.fromisoformat(self.config.temporal.end_date)
-        
-        return self.random_date_between(start_date, end_date)
+        return self.random_config_datetime()
     
     def _add_non_english_documents(self, documents: List[Document]) -> None:
         """Convert some documents to non-English languages."""
@@ -409,39 +527,57 @@ class DocumentGenerator(BaseGenerator):
         if len(documents) < non_english_count:
             return
         
-        # Select random documents to convert
-        docs_to_convert = self.random.sample(documents, non_english_count)
+        # Select random documents to convert in a single skip-ahead pass
+        docs_to_convert = reservoir_sample(documents, non_english_count, self.random)
         
-        for doc in docs_to_convert:
-            language = self.random_choice(self.languages)
-            doc.language = language["code"]
+        languages = self._choices(self._language_markers, k=non_english_count)
+        for doc, (code, title_marker, content_marker) in zip(docs_to_convert, languages):
+            doc.language = code
             
             # Add language indicator to title
-            doc.title = f"[{language['name']}] {doc.title}"
+            doc.title = title_marker + doc.title
             
-            # Modify content to indicate different language
-            doc.content = f"[Content in {language['name']}]\n\n" + doc.content[:200] + "..."
+            # Modify content to indicate different language, keeping its first 200 characters
+            doc.content = f"{content_marker}{doc.content[:200]}..."
     
     def _add_document_relationships(self, documents: List[Document]) -> None:
         """Add cross-references between related documents."""
-        # Group documents by tags for relationship detection
-        tag_groups = {}
-        for doc in documents:
+        # Group document indices by tags for relationship detection
+        tag_groups = defaultdict(list)
+        for i, doc in enumerate(documents):
             for tag in doc.tags:
-                if tag not in tag_groups:
-                    tag_groups[tag] = []
-                tag_groups[tag].append(doc)
-        
-        # Add relationships for documents with common tags
-        for tag, docs in tag_groups.items():
-            if len(docs) > 1:
-                for doc in docs:
-                    # Add 1-2 related documents
-                    related_docs = [d for d in docs if d.doc_id != doc.doc_id]
-                    if related_docs:
-                        related_count = min(2, len(related_docs))
-                        related = self.random.sample(related_docs, related_count)
-                        doc.related_doc_ids = [d.doc_id for d in related]
+                tag_groups[tag].append(i)
+        
+        # Add 1-2 related documents sharing at least one tag
+        for i, doc in enumerate(documents):
+            groups = [tag_groups[tag] for tag in doc.tags]
+            related = self._pick_related_indices(i, groups, 2)
+            if related:
+                doc.related_doc_ids = [documents[j].doc_id for j in related]
+    
+    def _pick_related_indices(self, index: int, groups: List[List[int]], count: int) -> List[int]:
+        """Pick up to count distinct documents other than index from its tag groups.
+        
+        Every distinct document sharing at least one tag is equally likely to be picked.
+        
+        Args:
+            index: Index of the document to find relations for
+            groups: Index lists of the tag groups the document belongs to
+            count: Maximum number of related documents
+            
+        Returns:
+            List of related document indices
+        """
+        seen = {index}
+        
+        def candidates():
+            for group in groups:
+                for j in group:
+                    if j not in seen:
+                        seen.add(j)
+                        yield j
+        
+        return reservoir_sample(candidates(), count, self.random)
     
     def get_generation_progress(self) -> Dict[str, Any]:
         """Get progress information for document generation."""
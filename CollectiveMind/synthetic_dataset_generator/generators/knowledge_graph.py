@@ -1,9 +1,10 @@
 """Knowledge graph generator for creating relationships and serendipity insights."""
 
 import random
-from typing import List, Dict, Any, Tuple, Set
+from typing import List, Dict, Any, Optional, Tuple, Set
 from datetime import datetime, timedelta
-from collections import defaultdict
+from collections import Counter, defaultdict
+from itertools import chain, combinations
 
 from .base import BaseGenerator
 from .context import ContextManager
@@ -12,6 +13,29 @@ from ..models.knowledge_graph import KnowledgeGraphEdge, Overlap
 from ..config.settings import GenerationConfig
 
 
+# Possible days between an edge's first and last sighting
+_ACTIVE_DAYS = range(91)
+
+# Edge types generated at random to reach the target edge count
+_RANDOM_EDGE_TYPES = ("AUTHORED", "VIEWED")
+
+# Word groups whose topics relate to each other: (one side, other side)
+_RELATED_PATTERNS = (
+    # Customer-related topics
+    (("customer", "churn", "retention"), ("customer", "engagement", "satisfaction", "feedback")),
+    # Performance topics
+    (("performance", "metrics"), ("analytics", "monitoring", "optimization")),
+    # Product topics
+    (("product", "feature"), ("user", "experience", "adoption", "roadmap")),
+    # Financial topics
+    (("revenue", "cost", "budget"), ("pricing", "ROI", "financial")),
+    # Technical topics
+    (("system", "architecture"), ("performance", "scalability", "infrastructure")),
+    # Process topics
+    (("process", "workflow"), ("automation", "optimization", "efficiency"))
+)
+
+
 class KnowledgeGraphGenerator(BaseGenerator):
     """Generates knowledge graph edges and serendipity insights."""
     
@@ -68,6 +92,25 @@ class KnowledgeGraphGenerator(BaseGenerator):
         self.edge_counter = 0
         self.topic_counter = 0
         self.overlap_counter = 0
+        
+        # Context snapshots and document indexes, built once per generate() call
+        # (see _prepare_doc_index); the context is not modified while edges are built
+        self._docs: Tuple[Any, ...] = ()
+        self._doc_ids: Tuple[str, ...] = ()
+        self._person_ids: Tuple[str, ...] = ()
+        self._docs_by_team: Dict[str, List[Any]] = {}
+        
+        # Distinct document tags, and per team a bitmask of its tags (bit i is self._tags[i])
+        self._tags: List[str] = []
+        self._team_tag_masks: Dict[str, int] = {}
+        
+        # Lower-cased searchable text and memoized keyword matches for overlaps
+        # (see _prepare_keyword_index)
+        self._doc_texts: List[str] = []
+        self._threads: Tuple[Any, ...] = ()
+        self._thread_texts: List[str] = []
+        self._keyword_docs: Dict[str, Set[int]] = {}
+        self._keyword_threads: Dict[str, Set[int]] = {}
     
     def generate(self) -> Tuple[List[Topic], List[KnowledgeGraphEdge], List[Overlap]]:
         """Generate complete knowledge graph with topics, edges, and overlaps."""
@@ -75,6 +118,10 @@ class KnowledgeGraphGenerator(BaseGenerator):
         # Generate topics first
         print("   Generating topics...")
         topics = self._generate_topics()
+        self.generated_topics = topics  # Read by the topic edge generators
+        
+        # Index the registered documents once for edges and overlaps
+        self._prepare_doc_index()
         
         # Generate knowledge graph edges
         print("   Generating knowledge graph edges...")
@@ -85,8 +132,7 @@ class KnowledgeGraphGenerator(BaseGenerator):
         overlaps = self._generate_overlaps()
         
         # Register topics in context
-        for topic in topics:
-            self.context.register_entity('topic', topic.topic_id, topic)
+        self.context.register_entities('topic', ((topic.topic_id, topic) for topic in topics))
         
         self.generated_topics = topics
         self.generated_edges = edges
@@ -198,62 +244,59 @@ class KnowledgeGraphGenerator(BaseGenerator):
         )
     
     def _add_topic_relationships(self, topics: List[Topic]) -> None:
-        """Add relationships between topics."""
-        for topic in topics:
-            # Find related topics based on name similarity and business logic
-            related_topics = []
-            
-            for other_topic in topics:
-                if other_topic.topic_id == topic.topic_id:
-                    continue
-                
-                # Check for semantic relationships
-                if self._are_topics_related(topic.name, other_topic.name):
-                    related_topics.append(other_topic.topic_id)
+        """Add relationships between topics.
+        
+        Two topics are related if their names share a word, or if one name has a word
+        from one side of a relationship pattern and the other a word from the opposite
+        side. Topic sets are kept as bitsets (bit i for topics[i]) so each topic's
+        related topics come from a few integer ORs instead of testing every pair.
+        """
+        word_sets = [frozenset(topic.name.lower().split()) for topic in topics]
+        topics_by_word = defaultdict(int)
+        for i, words in enumerate(word_sets):
+            for word in words:
+                topics_by_word[word] |= 1 << i
+        
+        # Pattern sides are numbered 2p and 2p + 1 for pattern p: opposite_topics[s] is
+        # the bitset of topics matching the side opposite s, and side_masks[i] has bit s
+        # set if topics[i] matches side s
+        opposite_topics = []
+        side_masks = [0] * len(topics)
+        for pattern in _RELATED_PATTERNS:
+            side_topics = [0, 0]
+            for side, words in enumerate(pattern):
+                for word in words:
+                    side_topics[side] |= topics_by_word.get(word, 0)
+                side_bit = 1 << (len(opposite_topics) + side)
+                for i, topic_words in enumerate(word_sets):
+                    if not topic_words.isdisjoint(words):
+                        side_masks[i] |= side_bit
+            opposite_topics += (side_topics[1], side_topics[0])
+        
+        for i, (topic, words) in enumerate(zip(topics, word_sets)):
+            # Direct word overlap, then topics across any pattern side the topic matches
+            related = 0
+            for word in words:
+                related |= topics_by_word[word]
+            mask = side_masks[i]
+            while mask:
+                side = mask.bit_length() - 1
+                related |= opposite_topics[side]
+                mask ^= 1 << side
+            related &= ~(1 << i)
             
             # Limit to 3-5 related topics
-            if related_topics:
+            if related:
+                related_topics = []
+                while related:
+                    lowest = related & -related
+                    related_topics.append(topics[lowest.bit_length() - 1].topic_id)
+                    related ^= lowest
                 topic.related_topic_ids = self.random.sample(
                     related_topics, 
                     min(self.random.randint(2, 4), len(related_topics))
                 )
     
-    def _are_topics_related(self, topic1: str, topic2: str) -> bool:
-        """Determine if two topics are semantically related."""
-        # Define relationship patterns
-        related_patterns = [
-            # Customer-related topics
-            (["customer", "churn", "retention"], ["customer", "engagement", "satisfaction", "feedback"]),
-            # Performance topics
-            (["performance", "metrics"], ["analytics", "monitoring", "optimization"]),
-            # Product topics
-            (["product", "feature"], ["user", "experience", "adoption", "roadmap"]),
-            # Financial topics
-            (["revenue", "cost", "budget"], ["pricing", "ROI", "financial"]),
-            # Technical topics
-            (["system", "architecture"], ["performance", "scalability", "infrastructure"]),
-            # Process topics
-            (["process", "workflow"], ["automation", "optimization", "efficiency"])
-        ]
-        
-        topic1_words = set(topic1.lower().split())
-        topic2_words = set(topic2.lower().split())
-        
-        for pattern1, pattern2 in related_patterns:
-            if (any(word in topic1_words for word in pattern1) and 
-                any(word in topic2_words for word in pattern2)):
-                return True
-            if (any(word in topic1_words for word in pattern2) and 
-                any(word in topic2_words for word in pattern1)):
-                return True
-        
-        # Check for direct word overlap
-        common_words = topic1_words.intersection(topic2_words)
-        if len(common_words) > 0:
-            return True
-        
-        return False
-    
     def _generate_edges(self) -> List[KnowledgeGraphEdge]:
         """Generate knowledge graph edges between entities."""
         edges = []
@@ -282,19 +325,41 @@ class KnowledgeGraphGenerator(BaseGenerator):
         # Generate VERSION_OF edges (document versions)
         edges.extend(self._generate_version_edges())
         
-        # Generate additional edges to reach target count
-        while len(edges) < self.config.content_volumes.knowledge_graph_edges:
-            edge = self._generate_random_edge()
-            if edge:
-                edges.append(edge)
+        # The configured edge count is a minimum: every real edge is kept, and
+        # random edges only make up a shortfall
+        edges.extend(self._generate_random_edges(
+            self.config.content_volumes.knowledge_graph_edges - len(edges)))
         
-        return edges[:self.config.content_volumes.knowledge_graph_edges]
+        return edges
+    
+    def _prepare_doc_index(self) -> None:
+        """Snapshot registered people and documents and index documents by team."""
+        self._docs = tuple(self.context.documents.values())
+        self._doc_ids = tuple(self.context.documents)
+        self._person_ids = tuple(self.context.people)
+        
+        docs_by_team = defaultdict(list)
+        team_tag_masks = defaultdict(int)
+        tag_bits: Dict[str, int] = {}
+        for doc in self._docs:
+            docs_by_team[doc.team].append(doc)
+            mask = 0
+            for tag in doc.tags:
+                bit = tag_bits.get(tag)
+                if bit is None:
+                    bit = tag_bits[tag] = 1 << len(tag_bits)
+                mask |= bit
+            team_tag_masks[doc.team] |= mask
+        
+        self._docs_by_team = dict(docs_by_team)
+        self._tags = list(tag_bits)
+        self._team_tag_masks = dict(team_tag_masks)
     
     def _generate_authored_edges(self) -> List[KnowledgeGraphEdge]:
         """Generate AUTHORED edges between people and documents."""
         edges = []
         
-        for doc in self.context.documents.values():
+        for doc in self._docs:
             # Author edge
             edge = self._create_edge(
                 "AUTHORED",
@@ -322,14 +387,23 @@ class KnowledgeGraphGenerator(BaseGenerator):
         """Generate VIEWED edges (people viewing documents)."""
         edges = []
         
+        # Documents outside each team, built once per team in document order
+        other_docs_by_team: Dict[str, List[Any]] = {}
+        
+        # Evidence text per viewed document, shared by all of its VIEWED edges
+        view_evidence: Dict[str, str] = {}
+        
         # Generate realistic viewing patterns
         for person in self.context.people.values():
             # People view 5-15 documents
             view_count = self.random.randint(5, 15)
             
             # Prefer documents from same team, but also cross-team
-            same_team_docs = [d for d in self.context.documents.values() if d.team == person.team]
-            other_team_docs = [d for d in self.context.documents.values() if d.team != person.team]
+            same_team_docs = self._docs_by_team.get(person.team, [])
+            other_team_docs = other_docs_by_team.get(person.team)
+            if other_team_docs is None:
+                other_team_docs = other_docs_by_team[person.team] = [
+                    d for d in self._docs if d.team != person.team]
             
             # 70% same team, 30% cross-team
             same_team_views = int(view_count * 0.7)
@@ -347,14 +421,23 @@ class KnowledgeGraphGenerator(BaseGenerator):
                     min(cross_team_views, len(other_team_docs))
                 ))
             
-            for doc in viewed_docs:
+            # Draw the person's view timestamps in one batch
+            view_times = [self.random_config_datetime() for _ in viewed_docs]
+            view_days = self._choices(_ACTIVE_DAYS, k=len(viewed_docs))
+            
+            for doc, first_seen, active_days in zip(viewed_docs, view_times, view_days):
                 weight = 0.9 if doc.team == person.team else 0.6
+                evidence = view_evidence.get(doc.doc_id)
+                if evidence is None:
+                    evidence = view_evidence[doc.doc_id] = f"Viewed document: {doc.title}"
                 edge = self._create_edge(
                     "VIEWED",
                     "PERSON", person.person_id,
                     "DOC", doc.doc_id,
                     weight=weight,
-                    evidence=f"Viewed document: {doc.title}"
+                    evidence=evidence,
+                    first_seen=first_seen,
+                    active_days=active_days
                 )
                 edges.append(edge)
         
@@ -373,7 +456,7 @@ class KnowledgeGraphGenerator(BaseGenerator):
                         "DOC", doc_ref,
                         "THREAD", message.thread_id,
                         weight=0.7,
-                        evidence=f"Document referenced in chat thread"
+                        evidence="Document referenced in chat thread"
                     )
                     edges.append(edge)
         
@@ -383,40 +466,45 @@ class KnowledgeGraphGenerator(BaseGenerator):
         """Generate CO_OCCURS_WITH edges for topics appearing together."""
         edges = []
         
-        # Track topic co-occurrences in documents
-        topic_cooccurrence = defaultdict(lambda: defaultdict(int))
+        # Count documents per co-occurring topic pair, each pair keyed once in sorted order
+        topic_cooccurrence = Counter()
+        
+        # Topics matched by each distinct tag, resolved on first sight since
+        # documents draw their tags from a small shared vocabulary
+        topic_keys = [(topic.topic_id, topic.name.lower(), {alias.lower() for alias in topic.aliases})
+                      for topic in self.generated_topics]
+        tag_topics: Dict[str, List[str]] = {}
         
-        for doc in self.context.documents.values():
-            doc_topics = []
+        for doc in self._docs:
+            doc_topics = set()
             
             # Extract topics from document tags and content
             for tag in doc.tags:
-                # Find matching topics
-                for topic in self.generated_topics:
-                    if (tag.lower() in topic.name.lower() or 
-                        topic.name.lower() in tag.lower() or
-                        any(alias.lower() == tag.lower() for alias in topic.aliases)):
-                        doc_topics.append(topic.topic_id)
+                matches = tag_topics.get(tag)
+                if matches is None:
+                    # A tag matches a topic it is part of, contains, or names by alias
+                    tag_lower = tag.lower()
+                    matches = tag_topics[tag] = [
+                        topic_id for topic_id, name, aliases in topic_keys
+                        if tag_lower in name or name in tag_lower or tag_lower in aliases
+                    ]
+                doc_topics.update(matches)
             
-            # Create co-occurrence edges
-            for i, topic1 in enumerate(doc_topics):
-                for topic2 in doc_topics[i+1:]:
-                    topic_cooccurrence[topic1][topic2] += 1
-                    topic_cooccurrence[topic2][topic1] += 1
+            # Count each distinct pair of the document's topics once
+            topic_cooccurrence.update(combinations(sorted(doc_topics), 2))
         
         # Generate edges for significant co-occurrences
-        for topic1, cooccurrences in topic_cooccurrence.items():
-            for topic2, count in cooccurrences.items():
-                if count >= 2:  # Minimum 2 co-occurrences
-                    weight = min(1.0, count / 5.0)  # Scale weight
-                    edge = self._create_edge(
-                        "CO_OCCURS_WITH",
-                        "TOPIC", topic1,
-                        "TOPIC", topic2,
-                        weight=weight,
-                        evidence=f"Co-occurred in {count} documents"
-                    )
-                    edges.append(edge)
+        for (topic1, topic2), count in topic_cooccurrence.items():
+            if count >= 2:  # Minimum 2 co-occurrences
+                weight = min(1.0, count / 5.0)  # Scale weight
+                edge = self._create_edge(
+                    "CO_OCCURS_WITH",
+                    "TOPIC", topic1,
+                    "TOPIC", topic2,
+                    weight=weight,
+                    evidence=f"Co-occurred in {count} documents"
+                )
+                edges.append(edge)
         
         return edges
     
@@ -447,61 +535,64 @@ class KnowledgeGraphGenerator(BaseGenerator):
                 if team1 >= team2:  # Avoid duplicates
                     continue
                 
-                # Find shared topics between teams
-                team1_topics = set()
-                team2_topics = set()
-                
-                for doc in self.context.documents.values():
-                    if doc.team == team1:
-                        team1_topics.update(doc.tags)
-                    elif doc.team == team2:
-                        team2_topics.update(doc.tags)
+                # Find shared topics between teams as a tag bitmask
+                shared_mask = self._team_tag_masks.get(team1, 0) & self._team_tag_masks.get(team2, 0)
                 
-                shared_topics = team1_topics.intersection(team2_topics)
-                
-                if shared_topics:
-                    weight = min(1.0, len(shared_topics) / 5.0)
+                if shared_mask:
+                    weight = min(1.0, shared_mask.bit_count() / 5.0)
+                    
+                    # Name the first three shared tags, in order of first appearance
+                    shared_topics = []
+                    while shared_mask and len(shared_topics) < 3:
+                        lowest = shared_mask & -shared_mask
+                        shared_topics.append(self._tags[lowest.bit_length() - 1])
+                        shared_mask ^= lowest
+                    
                     edge = self._create_edge(
                         "TEAM_OVERLAP",
                         "TEAM", team1,
                         "TEAM", team2,
                         weight=weight,
-                        evidence=f"Shared topics: {', '.join(list(shared_topics)[:3])}"
+                        evidence=f"Shared topics: {', '.join(shared_topics)}"
                     )
                     edges.append(edge)
         
         return edges
     
     def _generate_worked_with_edges(self) -> List[KnowledgeGraphEdge]:
-        """Generate WORKED_WITH edges between people."""
+        """Generate WORKED_WITH edges between people.
+        
+        Each pair of people gets one edge per distinct collaboration: per document
+        they co-authored and per chat channel they share. Repeat collaborations in
+        the same channel (several threads) are merged into that channel's edge.
+        """
         edges = []
         
-        # People who co-authored documents
-        for doc in self.context.documents.values():
-            if doc.co_authors:
-                for co_author in doc.co_authors:
-                    edge = self._create_edge(
-                        "WORKED_WITH",
-                        "PERSON", doc.author_person_id,
-                        "PERSON", co_author,
-                        weight=0.9,
-                        evidence=f"Co-authored: {doc.title}"
-                    )
-                    edges.append(edge)
+        # People who co-authored documents, then people in same chat threads
+        collaborations = chain(
+            ((doc.author_person_id, co_author, 0.9, f"Co-authored: {doc.title}")
+             for doc in self._docs for co_author in doc.co_authors),
+            ((person1, person2, 0.6, f"Collaborated in chat: {thread.channel}")
+             for thread in self.context.chat_threads.values()
+             for person1, person2 in combinations(thread.participants, 2)),
+        )
         
-        # People in same chat threads
-        for thread in self.context.chat_threads.values():
-            if len(thread.participants) > 1:
-                for i, person1 in enumerate(thread.participants):
-                    for person2 in thread.participants[i+1:]:
-                        edge = self._create_edge(
-                            "WORKED_WITH",
-                            "PERSON", person1,
-                            "PERSON", person2,
-                            weight=0.6,
-                            evidence=f"Collaborated in chat: {thread.channel}"
-                        )
-                        edges.append(edge)
+        # Dedupe on (unordered pair, evidence), keeping first-seen order
+        pairs: Dict[Tuple[str, str, str], float] = {}
+        for person1, person2, weight, evidence in collaborations:
+            if person2 < person1:
+                person1, person2 = person2, person1
+            pairs.setdefault((person1, person2, evidence), weight)
+        
+        for (person1, person2, evidence), weight in pairs.items():
+            edge = self._create_edge(
+                "WORKED_WITH",
+                "PERSON", person1,
+                "PERSON", person2,
+                weight=weight,
+                evidence=evidence
+            )
+            edges.append(edge)
         
         return edges
     
@@ -511,7 +602,7 @@ class KnowledgeGraphGenerator(BaseGenerator):
         
         # For now, create some sample version relationships
         # In a full implementation, this would use the document versioning system
-        docs = list(self.context.documents.values())
+        docs = self._docs
         
         # Create 5-10 version relationships
         for _ in range(self.random.randint(5, 10)):
@@ -527,45 +618,76 @@ class KnowledgeGraphGenerator(BaseGenerator):
                         "DOC", doc2.doc_id,
                         "DOC", doc1.doc_id,
                         weight=1.0,
-                        evidence=f"Updated version of document"
+                        evidence="Updated version of document"
                     )
                     edges.append(edge)
         
         return edges
     
-    def _generate_random_edge(self) -> KnowledgeGraphEdge:
-        """Generate a random edge to fill remaining quota."""
-        edge_types = list(self.edge_type_weights.keys())
-        edge_type = self.weighted_choice(edge_types, list(self.edge_type_weights.values()))
-        
-        # Generate appropriate source and destination based on edge type
-        if edge_type in ["AUTHORED", "VIEWED"]:
-            person_ids = list(self.context.people.keys())
-            doc_ids = list(self.context.documents.keys())
-            
-            if person_ids and doc_ids:
-                return self._create_edge(
-                    edge_type,
-                    "PERSON", self.random_choice(person_ids),
-                    "DOC", self.random_choice(doc_ids),
-                    weight=self.random.uniform(0.3, 0.8),
-                    evidence="Random relationship"
-                )
+    def _generate_random_edges(self, count: int) -> List[KnowledgeGraphEdge]:
+        """Generate random person-document edges to fill the remaining quota.
         
-        return None
+        Args:
+            count: Number of edges to generate
+            
+        Returns:
+            List of random edges, empty if there are no people or documents
+        """
+        person_ids = self._person_ids
+        doc_ids = self._doc_ids
+        if count <= 0 or not person_ids or not doc_ids:
+            return []
+        
+        # Only person-document edge types can be filled at random, so draw from
+        # their weights alone, with every edge's endpoints drawn in the same batch
+        edge_types = self._choices(_RANDOM_EDGE_TYPES, weights=[
+            self.edge_type_weights[edge_type] for edge_type in _RANDOM_EDGE_TYPES], k=count)
+        src_ids = self._choices(person_ids, k=count)
+        dst_ids = self._choices(doc_ids, k=count)
+        
+        uniform = self.random.uniform
+        return [
+            self._create_edge(
+                edge_type,
+                "PERSON", src_id,
+                "DOC", dst_id,
+                weight=uniform(0.3, 0.8),
+                evidence="Random relationship"
+            )
+            for edge_type, src_id, dst_id in zip(edge_types, src_ids, dst_ids)
+        ]
     
     def _create_edge(self, edge_type: str, src_type: str, src_id: str,
-                    dst_type: str, dst_id: str, weight: float, evidence: str) -> KnowledgeGraphEdge:
-        """Create a knowledge graph edge."""
+                    dst_type: str, dst_id: str, weight: float, evidence: str,
+                    first_seen: Optional[datetime] = None,
+                    active_days: Optional[int] = None) -> KnowledgeGraphEdge:
+        """Create a knowledge graph edge.
+        
+        Bulk generators may pass timestamps drawn in batch; any left out are drawn here.
+        
+        Args:
+            edge_type: Relationship type
+            src_type: Type of the source entity
+            src_id: ID of the source entity
+            dst_type: Type of the destination entity
+            dst_id: ID of the destination entity
+            weight: Edge weight
+            evidence: Human-readable reason for the edge
+            first_seen: When the relationship was first seen
+            active_days: Days between first and last sighting (0-90)
+            
+        Returns:
+            Generated edge
+        """
         self.edge_counter += 1
         edge_id = f"E_{self.edge_counter:04d}"
         
         # Generate realistic timestamps
-        first_seen = self.random_date_between(
-            datetime.fromisoformat(self.config.temporal.start_date),
-            datetime.fromisoformat(self.config.temporal.end_date)
-        )
-        last_seen = first_seen + timedelta(days=self.random.randint(0, 90))
+        if first_seen is None:
+            first_seen = self.random_config_datetime()
+        if active_days is None:
+            active_days = self.random.randint(0, 90)
+        last_seen = first_seen + timedelta(days=active_days)
         
         return KnowledgeGraphEdge(
             edge_id=edge_id,
@@ -583,6 +705,7 @@ class KnowledgeGraphGenerator(BaseGenerator):
     def _generate_overlaps(self) -> List[Overlap]:
         """Generate cross-team overlap insights."""
         overlaps = []
+        self._prepare_keyword_index()
         
         # Generate mandatory overlaps
         for overlap_config in self.mandatory_overlaps:
@@ -632,25 +755,50 @@ class KnowledgeGraphGenerator(BaseGenerator):
         
         return overlaps
     
+    def _prepare_keyword_index(self) -> None:
+        """Lower-case the searchable text of documents and threads once for overlap matching."""
+        # Newline-separated so no keyword can match across title and tags
+        self._doc_texts = [f"{doc.title}\n{' '.join(doc.tags)}".lower() for doc in self._docs]
+        self._threads = tuple(self.context.chat_threads.values())
+        self._thread_texts = [' '.join(thread.topic_tags).lower() for thread in self._threads]
+        self._keyword_docs = {}
+        self._keyword_threads = {}
+    
+    @staticmethod
+    def _keyword_matches(keyword: str, texts: List[str], memo: Dict[str, Set[int]]) -> Set[int]:
+        """Get the indices of texts containing keyword, scanning them only on first lookup.
+        
+        Args:
+            keyword: Lower-case keyword to look for
+            texts: Lower-cased texts to search
+            memo: Matches already found, keyed by keyword
+            
+        Returns:
+            Set of indices into texts
+        """
+        matches = memo.get(keyword)
+        if matches is None:
+            matches = memo[keyword] = {i for i, text in enumerate(texts) if keyword in text}
+        return matches
+    
     def _create_overlap(self, topic_name: str, teams: List[str], description: str) -> Overlap:
         """Create a cross-team overlap insight."""
         self.overlap_counter += 1
         overlap_id = f"OVERLAP_{self.overlap_counter:03d}"
         
-        # Find supporting documents
-        supporting_docs = []
-        for doc in self.context.documents.values():
-            if (doc.team in teams and 
-                any(keyword in doc.title.lower() or keyword in ' '.join(doc.tags).lower() 
-                    for keyword in topic_name.lower().split())):
-                supporting_docs.append(doc.doc_id)
+        keywords = topic_name.lower().split()
+        
+        # Find supporting documents: from the given teams, mentioning any keyword
+        doc_indices = set().union(*(self._keyword_matches(keyword, self._doc_texts, self._keyword_docs)
+                                    for keyword in keywords))
+        supporting_docs = [self._docs[i].doc_id for i in sorted(doc_indices)
+                           if self._docs[i].team in teams]
         
         # Find supporting threads
-        supporting_threads = []
-        for thread in self.context.chat_threads.values():
-            if any(keyword in ' '.join(thread.topic_tags).lower() 
-                   for keyword in topic_name.lower().split()):
-                supporting_threads.append(thread.thread_id)
+        thread_indices = set().union(*(self._keyword_matches(keyword, self._thread_texts,
+                                                             self._keyword_threads)
+                                       for keyword in keywords))
+        supporting_threads = [self._threads[i].thread_id for i in sorted(thread_indices)]
         
         # Find people to suggest for collaboration
         people_suggested = []
@@ -283,7 +283,7 @@ class MeetingGenerator(BaseGenerator):
         
         elif meeting_type == "leadership":
             # Managers and senior people
-            managers = [p for p in all_people if p.person_id in self.context.managers]
+            managers = [p for p in all_people if self.context.is_manager(p.person_id)]
             senior_people = [p for p in all_people if p.tenure_months > 24]
             
             # Remove duplicates by person_id
@@ -306,8 +306,8 @@ class MeetingGenerator(BaseGenerator):
     
     def _generate_meeting_date(self) -> datetime:
         """Generate realistic meeting date during business hours."""
-        start_date = datetime.fromisoformat(self.config.temporal.start_date)
-        end_date = datetime.fromisoformat(self.config.temporal.end_date)
+        start_date = self.config.temporal.start_dt
+        end_date = self.config.temporal.end_dt
         
         base_date = self.random_date_between(start_date, end_date)
         
@@ -463,7 +463,7 @@ class MeetingGenerator(BaseGenerator):
         brief_id = f"BRIEF_ORG_{self.brief_counter:03d}"
         
         # Generate week date
-        start_date = datetime.fromisoformat(self.config.temporal.start_date)
+        start_date = self.config.temporal.start_dt
         week_date = start_date + timedelta(weeks=week_number)
         
         title = f"Weekly Organizational Brief - Week of {week_date.strftime('%B %d, %Y')}"
@@ -543,7 +543,7 @@ class MeetingGenerator(BaseGenerator):
         brief_id = f"BRIEF_{team.upper()}_{self.brief_counter:03d}"
         
         # Generate recent date
-        end_date = datetime.fromisoformat(self.config.temporal.end_date)
+        end_date = self.config.temporal.end_dt
         week_date = end_date - timedelta(days=self.random.randint(1, 30))
         
         title = f"{team} Team Weekly Brief - Week of {week_date.strftime('%B %d, %Y')}"
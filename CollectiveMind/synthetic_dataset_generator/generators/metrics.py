@@ -19,8 +19,8 @@ class MetricsGenerator(BaseGenerator):
         super().__init__(config, context)
         
         # Date range for metrics
-        self.start_date = datetime.fromisoformat(config.temporal.start_date)
-        self.end_date = datetime.fromisoformat(config.temporal.end_date)
+        self.start_date = config.temporal.start_dt
+        self.end_date = config.temporal.end_dt
         
         # Generate 18 months of data plus recent weekly slice
         self.monthly_months = 18
@@ -111,8 +111,7 @@ class OrganizationGenerator(BaseGenerator):
         self._create_team_history(people)
         
         # Register all people in context
-        for person in people:
-            self.context.register_entity('person', person.person_id, person)
+        self.context.register_entities('person', ((person.person_id, person) for person in people))
         
         self.generated_people = people
         return people
@@ -141,31 +140,33 @@ class OrganizationGenerator(BaseGenerator):
         """Create the specific demo personas."""
         demo_people = []
         
-        for i, persona in enumerate(self.config.demo_personas):
+        personas = zip(self.config.persona_names, self.config.persona_roles, self.config.persona_teams)
+        
+        for i, (name, role, team) in enumerate(personas):
             person_id = f"P_{i+1:03d}"
             
             # Generate email from name
-            name_parts = persona["name"].lower().split()
+            name_parts = name.lower().split()
             email = f"{name_parts[0]}.{name_parts[1]}@technova.com"
             
             # Get appropriate skills for team
             skills = self.random.sample(
-                self.team_skills.get(persona["team"], []), 
+                self.team_skills.get(team, []), 
                 self.random.randint(3, 6)
             )
             
             # Set tenure based on role
-            if "New Hire" in persona["role"]:
+            if "New Hire" in role:
                 tenure = self.random.randint(1, 3)  # 1-3 months
             else:
                 tenure = self.random.randint(12, 48)  # 1-4 years
             
             person = Person(
                 person_id=person_id,
-                full_name=persona["name"],
+                full_name=name,
                 email=email,
-                role_title=persona["role"],
-                team=persona["team"],
+                role_title=role,
+                team=team,
                 skills=skills,
                 tenure_months=tenure,
                 timezone=self.random_choice(self.timezones)
@@ -0,0 +1,39 @@
+"""Random sampling helpers shared by the generators."""
+
+import math
+import random
+from itertools import islice
+from typing import Any, Iterable, List
+
+
+# Sentinel for an exhausted iterator in reservoir_sample
+_MISSING = object()
+
+
+def reservoir_sample(items: Iterable[Any], k: int, rng: random.Random) -> List[Any]:
+    """Sample up to k items uniformly from an iterable in one pass (Algorithm L).
+    
+    Args:
+        items: Items to sample from
+        k: Maximum number of items to return
+        rng: Random number generator to draw from
+        
+    Returns:
+        List of sampled items in random order
+    """
+    iterator = iter(items)
+    reservoir = list(islice(iterator, k))
+    
+    if k > 0 and len(reservoir) == k:
+        # Skip ahead geometrically instead of drawing a number per item
+        w = math.exp(math.log(1.0 - rng.random()) / k)
+        while w < 1.0:
+            skip = math.floor(math.log(1.0 - rng.random()) / math.log(1.0 - w))
+            item = next(islice(iterator, skip, None), _MISSING)
+            if item is _MISSING:
+                break
+            reservoir[rng.randrange(k)] = item
+            w *= math.exp(math.log(1.0 - rng.random()) / k)
+    
+    rng.shuffle(reservoir)
+    return reservoir
@@ -169,8 +169,8 @@ class UserEventGenerator(BaseGenerator):
         behavior = persona_config["behavior_profile"]
         
         # Generate sessions over time
-        start_date = datetime.fromisoformat(self.config.temporal.start_date)
-        end_date = datetime.fromisoformat(self.config.temporal.end_date)
+        start_date = self.config.temporal.start_dt
+        end_date = self.config.temporal.end_dt
         
         # Calculate session frequency based on behavior
         frequency_map = {
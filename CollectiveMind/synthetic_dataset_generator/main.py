@@ -2,7 +2,6 @@
 
 import os
 import sys
-import random
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Any
@@ -277,7 +276,7 @@ class SyntheticDatasetGenerator:
                 "chat_threads_count": len(self.context.chat_threads),
                 "chat_messages_count": len(self.communication_generator.generated_messages),
                 "managers_count": len([p for p in self.context.people.values() 
-                                     if p.person_id in self.context.managers]),
+                                     if self.context.is_manager(p.person_id)]),
                 "duplicate_discussions": len([t for t in self.communication_generator.generated_threads if "DUP" in t.thread_id]),
                 "emotional_threads": len([t for t in self.communication_generator.generated_threads if "EMO" in t.thread_id]),
                 "csv_files_count": len(self.metrics_generator.generated_files),
@@ -313,7 +312,8 @@ class SyntheticDatasetGenerator:
             
             # Get team documents for starter pack
             team_docs = [doc for doc in self.context.documents.values() if doc.team == team]
-            selected_docs = random.sample(team_docs, min(6, len(team_docs)))
+            # Drawn from the document generator's RNG so seeding it covers starter packs too
+            selected_docs = self.document_generator.random.sample(team_docs, min(6, len(team_docs)))
             
             # Get team experts (people with longer tenure)
             team_people = self.context.get_people_by_team(team)
@@ -6,7 +6,7 @@ from typing import List, Optional
 import json
 
 
-@dataclass
+@dataclass(slots=True)
 class Person:
     """Represents an employee in the organization."""
     person_id: str
@@ -38,7 +38,7 @@ class Person:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Document:
     """Represents a document in the organizational knowledge base."""
     doc_id: str
@@ -98,7 +98,7 @@ class ChatThread:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatMessage:
     """Represents a message in a chat thread."""
     message_id: str
@@ -152,7 +152,7 @@ class Meeting:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Topic:
     """Represents a topic in the knowledge graph."""
     topic_id: str
@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class KnowledgeGraphEdge:
     """Represents an edge in the organizational knowledge graph."""
     edge_id: str
@@ -35,7 +35,7 @@ class KnowledgeGraphEdge:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Overlap:
     """Represents cross-team overlap insights."""
     overlap_id: str